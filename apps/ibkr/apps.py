@@ -10,17 +10,34 @@ class IbkrConfig(AppConfig):
     name = 'apps.ibkr'
 
     def ready(self):
-        """Start the auto-trade background scheduler when Django boots."""
+        """Tune SQLite connections and start the auto-trade background scheduler when Django boots."""
         import os
+        from django.db.backends.signals import connection_created
+        connection_created.connect(_apply_sqlite_pragmas, dispatch_uid='ibkr_sqlite_pragmas')
+
         # Only run in the main process (not the reloader child)
         if os.environ.get('RUN_MAIN') == 'true' or not os.environ.get('DJANGO_SETTINGS_MODULE'):
             pass  # dev-server reloader guard handled below
+        # Background refresh/sync command processes set up Django too; only the web
+        # process may run the scheduler, or a long job would place a second set of orders
+        if os.environ.get('IBKR_BACKGROUND_CHILD') == '1':
+            return
         # Avoid double-start in Django's autoreloader (which forks twice)
         if os.environ.get('RUN_MAIN', 'false') != 'true' and 'runserver' in os.sys.argv:
             return
         _start_auto_trade_scheduler()
 
 
+def _apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Tune each new SQLite connection with settings.SQLITE_PRAGMAS."""
+    if connection.vendor != 'sqlite':
+        return
+    from django.conf import settings
+    with connection.cursor() as cursor:
+        for pragma in getattr(settings, 'SQLITE_PRAGMAS', ()):
+            cursor.execute(pragma)
+
+
 def _start_auto_trade_scheduler():
     """Daemon thread: runs auto-trade once ~90s after startup, then every weekday at 09:35 ET."""
     import time
@@ -2,14 +2,20 @@
 Context processors for IBKR app
 Makes health check status available to all templates
 """
+from django.core.cache import cache
+
 from apps.ibkr.services.health_check import get_health_check_service
 
+HEALTH_STATUS_CACHE_KEY = 'health_quick_status'
+
 
 def health_status(request):
-    """Add health check status to template context"""
+    """Add health check status to template context (cached for 30s across requests)"""
     try:
-        health_service = get_health_check_service()
-        quick_status = health_service.get_quick_status()
+        quick_status = cache.get(HEALTH_STATUS_CACHE_KEY)
+        if quick_status is None:
+            quick_status = get_health_check_service().get_quick_status()
+            cache.set(HEALTH_STATUS_CACHE_KEY, quick_status, timeout=30)
         
         return {
             'health_status': quick_status,
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.1 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ibkr", "0008_autotrade"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="signal",
+            index=models.Index(
+                fields=["-quality_score", "-generated_at"],
+                name="ibkr_signal_quality_42a5e7_idx",
+            ),
+        ),
+    ]
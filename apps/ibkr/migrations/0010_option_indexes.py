@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-16 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ibkr", "0009_signal_quality_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="option",
+            index=models.Index(
+                fields=["stock", "option_type", "expiry_date"],
+                name="ibkr_option_stock_i_272ee2_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="option",
+            index=models.Index(
+                fields=["option_type", "expiry_date"],
+                name="ibkr_option_option__0832b5_idx",
+            ),
+        ),
+    ]
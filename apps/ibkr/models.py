@@ -52,6 +52,10 @@ class Option(models.Model):
     class Meta:
         ordering = ['stock', 'expiry_date', 'strike']
         unique_together = ['stock', 'expiry_date', 'strike', 'option_type']
+        indexes = [
+            models.Index(fields=['stock', 'option_type', 'expiry_date']),
+            models.Index(fields=['option_type', 'expiry_date']),
+        ]
     
     def __str__(self):
         return f"{self.stock.ticker} ${self.strike} {self.option_type} {self.expiry_date}"
@@ -113,6 +117,9 @@ class Signal(models.Model):
     
     class Meta:
         ordering = ['-quality_score', '-generated_at']
+        indexes = [
+            models.Index(fields=['-quality_score', '-generated_at']),
+        ]
     
     def __str__(self):
         return f"{self.stock.ticker} Signal - {self.signal_type} ({self.grade or self.status})"
@@ -9,13 +9,15 @@ class AIAnalyzer:
     """Provides AI-driven analysis and recommendations"""
     
     @staticmethod
-    def get_stock_recommendation(stock):
+    def get_stock_recommendation(stock, indicator=None):
         """
         Generate AI recommendation for a stock based on technical indicators
+        Pass an already-loaded indicator to skip resolving stock.indicators.
         Returns: dict with recommendation, confidence, reasoning, action
         """
         try:
-            indicator = stock.indicators
+            if indicator is None:
+                indicator = stock.indicators
         except StockIndicator.DoesNotExist:
             return {
                 'recommendation': 'Calculate Indicators',
@@ -106,12 +108,13 @@ class AIAnalyzer:
         }
     
     @staticmethod
-    def get_wheel_strategy_analysis(stock):
+    def get_wheel_strategy_analysis(stock, indicator=None):
         """
         Specific analysis for wheel strategy suitability
+        Pass an already-loaded indicator to skip resolving stock.indicators.
         Returns: dict with strategy recommendation
         """
-        analysis = AIAnalyzer.get_stock_recommendation(stock)
+        analysis = AIAnalyzer.get_stock_recommendation(stock, indicator=indicator)
         
         wheel_signals = []
         wheel_score = 0
@@ -135,7 +138,8 @@ class AIAnalyzer:
         
         # Check technical for wheel strategy
         try:
-            indicator = stock.indicators
+            if indicator is None:
+                indicator = stock.indicators
             
             if indicator.rsi and indicator.rsi < 40:
                 wheel_signals.append('✅ RSI favorable - Good put selling opportunity')
@@ -0,0 +1,177 @@
+"""
+Background Jobs - run long management commands in a separate process
+Keeps ORM-heavy refresh/sync work off the web process's GIL; output and
+progress are relayed back over a pipe into the Django cache for the status APIs
+"""
+import collections
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+# spawn (not fork) so the child never inherits the web process's DB/IB sockets
+_ctx = multiprocessing.get_context('spawn')
+
+# Relayed output is copied into the cache at most this often while a job runs
+OUTPUT_FLUSH_SECONDS = 1.0
+
+# Set in the environment of spawned command processes (see IbkrConfig.ready)
+BACKGROUND_CHILD_ENV = 'IBKR_BACKGROUND_CHILD'
+
+
+class RingBufferWriter:
+    """File-like output sink that keeps only the last max_lines lines"""
+
+    def __init__(self, max_lines=500):
+        self.lines = collections.deque(maxlen=max_lines)
+        self._partial = ''
+
+    def write(self, text):
+        parts = (self._partial + text).split('\n')
+        self._partial = parts.pop()
+        self.lines.extend(parts)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        if self._partial:
+            return '\n'.join([*self.lines, self._partial])
+        return '\n'.join(self.lines)
+
+
+class _PipeWriter:
+    """File-like stdout/stderr for the child that forwards writes to the parent"""
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def write(self, text):
+        if text:
+            self.conn.send(('output', text))
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _run_command_child(conn, command_name, options, progress_key):
+    """Child process entry point: set up Django, run the command, report back over conn"""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    # Set before setup() so IbkrConfig.ready() skips the auto-trade scheduler
+    os.environ[BACKGROUND_CHILD_ENV] = '1'
+    import django
+    django.setup()
+
+    from django.core.management import call_command, get_commands, load_command_class
+    from django.core.cache import cache as child_cache
+
+    try:
+        command = load_command_class(get_commands()[command_name], command_name)
+
+        # Commands publish progress to their own (process-local) cache; forward each update
+        if progress_key and hasattr(command, 'update_progress'):
+            update_progress = command.update_progress
+
+            def relay_progress(*args, **kwargs):
+                update_progress(*args, **kwargs)
+                conn.send(('progress', child_cache.get(progress_key)))
+
+            command.update_progress = relay_progress
+
+        out = _PipeWriter(conn)
+        call_command(command, stdout=out, stderr=out, **options)
+        conn.send(('done', None))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+def _relay_command_output(proc, conn, key_prefix, progress_key, timeout, on_complete, lock_key):
+    """Parent-side reader: mirror the child's messages into cache until it finishes"""
+    output = RingBufferWriter()  # bounded, however long the command runs
+    last_flush = 0.0
+    status = 'error'
+    error = 'Background process exited unexpectedly'
+    try:
+        while True:
+            kind, payload = conn.recv()
+            if kind == 'output':
+                output.write(payload)
+                now = time.monotonic()
+                if now - last_flush >= OUTPUT_FLUSH_SECONDS:
+                    cache.set(f'{key_prefix}_output', output.getvalue(), timeout=timeout)
+                    last_flush = now
+            elif kind == 'progress':
+                cache.set(progress_key, payload, timeout=3600)
+            elif kind == 'done':
+                status = 'completed'
+                break
+            elif kind == 'error':
+                error = payload
+                break
+    except EOFError:
+        pass
+    finally:
+        conn.close()
+        proc.join()
+
+    try:
+        if status == 'completed' and on_complete:
+            on_complete()
+    except Exception as e:
+        status = 'error'
+        error = str(e)
+    finally:
+        connection.close()
+
+    cache.set(f'{key_prefix}_output', output.getvalue(), timeout=timeout)
+    if status == 'completed':
+        cache.set(f'{key_prefix}_status', 'completed', timeout=timeout)
+    else:
+        logger.error(f"❌ Background command for {key_prefix} failed: {error}")
+        cache.set(f'{key_prefix}_status', 'error', timeout=timeout)
+        cache.set(f'{key_prefix}_error', error, timeout=timeout)
+
+    if lock_key:
+        cache.delete(lock_key)
+
+
+def start_command_process(command_name, key_prefix, options=None, progress_key=None,
+                          timeout=300, on_complete=None, lock_key=None):
+    """
+    Run a management command in a spawned process.
+
+    Output, final status and error are written to {key_prefix}_output/_status/_error;
+    on_complete runs in the web process after the command succeeds, and lock_key
+    (taken by the caller with cache.add) is released once the job finishes.
+    """
+    cache.delete_many([f'{key_prefix}_output', f'{key_prefix}_error'])
+
+    recv_conn, send_conn = _ctx.Pipe(duplex=False)
+    proc = _ctx.Process(
+        target=_run_command_child,
+        args=(send_conn, command_name, options or {}, progress_key),
+        daemon=True,
+    )
+    proc.start()
+    send_conn.close()  # the child holds the only writer, so EOF means it exited
+
+    # One reader per child for its whole run: a reader queued behind another job
+    # would leave this child blocked on a full pipe
+    reader = threading.Thread(
+        target=_relay_command_output,
+        args=(proc, recv_conn, key_prefix, progress_key, timeout, on_complete, lock_key),
+        name=f'job-relay-{key_prefix}',
+        daemon=True,
+    )
+    reader.start()
+    return proc
@@ -651,3 +651,31 @@ class IBKRClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.disconnect()
+
+
+# Shared client for request handlers, so polling views don't rebuild one per call
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Return the process-wide IBKRClient, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = IBKRClient()
+        elif _ib_instance is not None and _client.ib is not _ib_instance:
+            # Another client reconnected and replaced the IB singleton
+            _client.ib = _ib_instance
+    return _client
+
+
+def reset_client():
+    """Disconnect the shared IB connection and drop the cached client; the next get_client() builds a fresh one."""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        _ib_run(client._do_disconnect)
+        client.connected = False
+        logger.info("Disconnected from IBKR")
@@ -4,6 +4,7 @@ Fetches options data from Yahoo Finance as fallback when IBKR data is unavailabl
 """
 
 import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
 from django.utils import timezone
@@ -38,13 +39,24 @@ class YFinanceOptionsService:
                 print(f"  ⚠️  No options expiration dates for {ticker}")
                 return []
             
+            def fetch_chain(expiry):
+                try:
+                    return stock.option_chain(expiry)
+                except Exception as e:
+                    print(f"  ⚠️  Error fetching {expiry}: {str(e)}")
+                    return None
+            
+            # Each expiry is a separate HTTPS round-trip to Yahoo; fetch them concurrently
+            # on the one Ticker (shared session), map() keeps expiry order
+            with ThreadPoolExecutor(max_workers=min(8, len(expirations))) as executor:
+                chains = list(executor.map(fetch_chain, expirations))
+            
             options_data = []
             
-            for expiry in expirations:
+            for expiry, opt_chain in zip(expirations, chains):
+                if opt_chain is None:
+                    continue
                 try:
-                    # Get options chain for this expiration
-                    opt_chain = stock.option_chain(expiry)
-                    
                     # Process calls
                     calls = opt_chain.calls
                     for _, row in calls.iterrows():
@@ -26,6 +26,7 @@ urlpatterns = [
     path('api/watchlist/add/', views.add_to_watchlist, name='api_watchlist_add'),
     path('api/watchlist/remove/', views.remove_from_watchlist, name='api_watchlist_remove'),
     path('options/sync/yfinance/', views.sync_yfinance_options_view, name='sync_yfinance_options'),
+    path('options/sync/yfinance/status/', views.sync_yfinance_options_status_api, name='sync_yfinance_options_status'),
     path('positions/', views.positions_list, name='positions'),
     path('positions/open/', views.open_position, name='open_position'),
     path('positions/close/<int:position_id>/', views.close_position, name='close_position'),
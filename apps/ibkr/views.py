@@ -44,24 +44,36 @@ def ibkr_debug(request):
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.utils import timezone
-from django.core.cache import cache
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connection, transaction
 from django.http import HttpResponse, JsonResponse
-from django.db.models import Avg
+from django.db.models import Avg, Count, ExpressionWrapper, F, FloatField, Max, Q
 from django.views.decorators.http import require_POST
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 import csv
+import functools
 import json
-from datetime import datetime
-from .models import Stock, Option, Signal, Watchlist, UserConfig, OptionPosition, StockWheelScore, StockIndicator, StockPosition
+from io import StringIO
+import numpy as np
+from datetime import date, datetime
+from .models import Stock, Option, Signal, Watchlist, UserConfig, OptionPosition, StockWheelScore, StockIndicator, StockPosition, Alert
 from .services.stock_data_fetcher import StockDataFetcher
 from .services.ai_analysis import AIAnalyzer
-from .services.ibkr_client import IBKRClient
+from .services.ibkr_client import get_client, reset_client
 from .services.position_analyzer import PositionAnalyzer
 from .services.technical_analysis import TechnicalAnalysisService
+from .services.alert_service import AlertService
+from .services.background_jobs import RingBufferWriter, start_command_process
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Reused workers for in-process background jobs (yfinance options sync, order position records)
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix='background')
+
 
 def _auto_expire_stale_positions():
     """Mark OPEN option positions whose expiry has passed as EXPIRED or ASSIGNED.
@@ -293,9 +305,9 @@ def hub(request):
     _auto_expire_stale_positions()
 
     # Option positions — evaluate QuerySet to list once so we can reuse without extra hits
-    open_positions = OptionPosition.objects.filter(status='OPEN').select_related('stock').order_by('-entry_date')
+    open_positions = OptionPosition.objects.filter(status='OPEN').select_related('stock', 'stock__indicators').order_by('-entry_date')
     open_positions_list = list(open_positions)  # single DB hit, reused below
-    closed_positions = OptionPosition.objects.exclude(status='OPEN').select_related('stock').order_by('-exit_date')[:10]
+    closed_positions = OptionPosition.objects.exclude(status='OPEN').select_related('stock', 'stock__indicators').order_by('-exit_date')[:10]
 
     # Account summary loaded async via /api/account-summary/ — skip sync fetch here
     # NOTE: Live IBKR quote refresh and AI analysis moved out of hub page load for performance.
@@ -310,7 +322,7 @@ def hub(request):
     filters_applied = bool(price_ranges)
     
     # Always process preferred stocks (My Stocks tab)
-    preferred_stocks_query = Stock.objects.filter(ticker__in=watchlist_tickers).select_related('indicators').prefetch_related('options')
+    preferred_stocks_query = Stock.objects.filter(ticker__in=watchlist_tickers).select_related('indicators').annotate(options_updated=Max('options__last_updated')).prefetch_related('options')
     preferred_stock_scores = []
     
     for stock in preferred_stocks_query:
@@ -318,7 +330,7 @@ def hub(request):
         stock.wheel_score = score_data['total_score']
         stock.score_breakdown = score_data
         
-        entry_signal = calculate_entry_signal(stock)
+        entry_signal = calculate_entry_signal(stock, want_reasons=False)
         stock.entry_signal = entry_signal['signal']
         stock.entry_quality = entry_signal['quality']
         stock.entry_score = entry_signal['score']
@@ -332,7 +344,7 @@ def hub(request):
     
     if filters_applied:
         # Fetch all stocks when price range filters are applied
-        all_stocks = Stock.objects.select_related('indicators').prefetch_related('options').all()
+        all_stocks = Stock.objects.select_related('indicators').annotate(options_updated=Max('options__last_updated')).prefetch_related('options')
         
         # Filter stocks by price range only (basic info, no complex calculations yet)
         for stock in all_stocks:
@@ -368,7 +380,7 @@ def hub(request):
                     stock.wheel_score = score_data['total_score']
                     stock.score_breakdown = score_data
                     
-                    entry_signal = calculate_entry_signal(stock)
+                    entry_signal = calculate_entry_signal(stock, want_reasons=False)
                     stock.entry_signal = entry_signal['signal']
                     stock.entry_quality = entry_signal['quality']
                     stock.entry_score = entry_signal['score']
@@ -405,10 +417,17 @@ def hub(request):
     selected_ticker = request.GET.get('ticker', '')
     selected_stock = None
     options = []
-    available_stocks = Stock.objects.filter(options__isnull=False).distinct().order_by('ticker')
+    # Single query for the ticker dropdown — only the columns the template renders
+    available_stocks = (
+        Stock.objects.filter(options__isnull=False)
+        .select_related('indicators')
+        .only('ticker', 'last_price', 'indicators__rsi')
+        .distinct()
+        .order_by('ticker')
+    )
 
     if selected_ticker:
-        selected_stock = Stock.objects.filter(ticker=selected_ticker).first()
+        selected_stock = Stock.objects.filter(ticker=selected_ticker).select_related('indicators').first()
         if selected_stock:
             from datetime import date as _date, timedelta as _timedelta
             today = _date.today()
@@ -437,7 +456,7 @@ def hub(request):
             options = options_qs.order_by('expiry_date', 'strike')
     
     # SIGNALS TAB DATA
-    signals = Signal.objects.filter(status='OPEN').select_related('stock', 'option').order_by('-quality_score')[:20]
+    signals = Signal.objects.filter(status='OPEN').select_related('stock', 'stock__indicators', 'option').order_by('-quality_score')[:20]
     
     context = {
         'last_updated': last_updated,
@@ -480,7 +499,7 @@ def dashboard(request):
     watchlist_tickers = list(watchlist.values_list('ticker', flat=True))
     
     # Only show stocks that are in the watchlist
-    stocks = Stock.objects.filter(ticker__in=watchlist_tickers).select_related('indicators').order_by('-last_updated')[:10]
+    stocks = Stock.objects.filter(ticker__in=watchlist_tickers).select_related('indicators').annotate(options_updated=Max('options__last_updated')).order_by('-last_updated')[:10]
     
     # Add AI analysis to each stock
     for stock in stocks:
@@ -507,7 +526,7 @@ def stocks_list(request):
         return render(request, 'ibkr/stocks.html', cached_data)
     
     # Scan ALL stocks in database, not just watchlist
-    stocks = Stock.objects.select_related('indicators').prefetch_related('options').all()
+    stocks = Stock.objects.select_related('indicators').annotate(options_updated=Max('options__last_updated')).prefetch_related('options')
     
     # Calculate wheel scores and entry signals for each stock
     stock_scores = []
@@ -596,6 +615,41 @@ def stocks_list(request):
     return render(request, 'ibkr/stocks.html', context)
 
 
+# Single-stock pages that score the stock: indicator + newest option stamp in the same query
+SCORED_STOCK_QS = Stock.objects.select_related('indicators').annotate(options_updated=Max('options__last_updated'))
+
+
+def _memoize_score(func):
+    """Cache a per-stock scoring function for 60s in the 'scores' cache.
+
+    Keyed on everything the scores read: the stock's last_updated and last_price,
+    its indicators' last_calculated and its newest option's last_updated, so hub,
+    stocks, options and stock_detail share one result until any of them changes.
+    Callers should load stocks with select_related('indicators') and
+    annotate(options_updated=Max('options__last_updated')) to keep the key
+    lookup free of per-stock queries.
+    """
+    @functools.wraps(func)
+    def wrapper(stock, *args, **kwargs):
+        try:
+            indicator_ts = stock.indicators.last_calculated
+        except StockIndicator.DoesNotExist:
+            indicator_ts = None
+        if hasattr(stock, 'options_updated'):
+            options_ts = stock.options_updated
+        else:
+            options_ts = stock.options.aggregate(latest=Max('last_updated'))['latest']
+        stamps = '_'.join(
+            str(ts.timestamp()) if ts else '0'
+            for ts in (stock.last_updated, indicator_ts, options_ts)
+        )
+        extra = '_'.join([str(a) for a in args] + [f"{k}={v}" for k, v in sorted(kwargs.items())])
+        cache_key = f"{func.__name__}_{stock.ticker}_{stock.last_price}_{stamps}_{extra}"
+        return caches['scores'].get_or_set(cache_key, lambda: func(stock, *args, **kwargs), timeout=60)
+    return wrapper
+
+
+@_memoize_score
 def calculate_wheel_score(stock):
     """
     Calculate multi-factor blended score for wheel strategy suitability
@@ -775,7 +829,8 @@ def calculate_wheel_score(stock):
     return scores
 
 
-def calculate_entry_signal(stock):
+@_memoize_score
+def calculate_entry_signal(stock, want_reasons=True):
     """
     Calculate entry signal for WHEEL STRATEGY - Selling Cash-Secured PUTS
     
@@ -791,6 +846,9 @@ def calculate_entry_signal(stock):
     4. Risk Factors (penalty) - Near resistance (bad for puts), overbought RSI
     
     Returns signal: SELL PUT NOW, WAIT, AVOID with quality rating 0-100
+
+    Pass want_reasons=False when only the signal/score is needed (e.g. list
+    views that never render the reasons) to skip formatting the reason strings.
     """
     signal_data = {
         'signal': 'WAIT',
@@ -818,43 +876,54 @@ def calculate_entry_signal(stock):
     if ind.rsi:
         if ind.rsi < 35:  # Oversold - EXCELLENT for weekly CSPs
             technical_score += 20
-            reasons.append(f"✅ RSI oversold ({ind.rsi:.1f}) - prime time for CSPs!")
+            if want_reasons:
+                reasons.append(f"✅ RSI oversold ({ind.rsi:.1f}) - prime time for CSPs!")
         elif 35 <= ind.rsi < 50:  # Weak - GOOD for CSPs
             technical_score += 15
-            reasons.append(f"✅ RSI favorable ({ind.rsi:.1f}) - good CSP entry")
+            if want_reasons:
+                reasons.append(f"✅ RSI favorable ({ind.rsi:.1f}) - good CSP entry")
         elif 50 <= ind.rsi < 65:  # Neutral - wait for better entry
             technical_score += 8
-            reasons.append(f"⏳ RSI neutral ({ind.rsi:.1f}) - wait for dip")
+            if want_reasons:
+                reasons.append(f"⏳ RSI neutral ({ind.rsi:.1f}) - wait for dip")
         elif 65 <= ind.rsi < 75:  # Elevated - caution
             technical_score += 3
-            reasons.append(f"⚠️ RSI elevated ({ind.rsi:.1f}) - not ideal")
+            if want_reasons:
+                reasons.append(f"⚠️ RSI elevated ({ind.rsi:.1f}) - not ideal")
         else:  # Overbought > 75 - avoid
             technical_score += 0
-            reasons.append(f"❌ RSI overbought ({ind.rsi:.1f}) - avoid CSPs!")
+            if want_reasons:
+                reasons.append(f"❌ RSI overbought ({ind.rsi:.1f}) - avoid CSPs!")
     
     # Price vs Support - Best when near support
     if ind.support_level_1 and stock.last_price:
         distance_to_support = ((float(stock.last_price) - float(ind.support_level_1)) / float(ind.support_level_1)) * 100
         if distance_to_support < 3:  # Within 3% of support
             technical_score += 15
-            reasons.append(f"✅ Near support ${ind.support_level_1} ({distance_to_support:.1f}% away)")
+            if want_reasons:
+                reasons.append(f"✅ Near support ${ind.support_level_1} ({distance_to_support:.1f}% away)")
         elif distance_to_support < 8:  # Within 8% of support
             technical_score += 10
-            reasons.append(f"↔️ Close to support ${ind.support_level_1} ({distance_to_support:.1f}% away)")
+            if want_reasons:
+                reasons.append(f"↔️ Close to support ${ind.support_level_1} ({distance_to_support:.1f}% away)")
         elif distance_to_support < 15:  # Within 15% of support
             technical_score += 5
-            reasons.append(f"⚠️ Moderate distance from support ({distance_to_support:.1f}%)")
+            if want_reasons:
+                reasons.append(f"⚠️ Moderate distance from support ({distance_to_support:.1f}%)")
     
     # Trend alignment - Above 50-day EMA (BULLISH) is REQUIRED for Weekly Wheel Strategy
     if ind.ema_trend == 'BULLISH':
         technical_score += 10
-        reasons.append("✅ Above 50-day EMA - ideal for weekly wheel")
+        if want_reasons:
+            reasons.append("✅ Above 50-day EMA - ideal for weekly wheel")
     elif ind.ema_trend == 'NEUTRAL':
         technical_score += 5
-        reasons.append("↔️ Neutral trend - acceptable")
+        if want_reasons:
+            reasons.append("↔️ Neutral trend - acceptable")
     else:
         technical_score += 0
-        reasons.append("⚠️ Below 50-day EMA - not ideal for CSPs")
+        if want_reasons:
+            reasons.append("⚠️ Below 50-day EMA - not ideal for CSPs")
     
     score += min(technical_score, 40)
     
@@ -872,16 +941,20 @@ def calculate_entry_signal(stock):
             iv_pct = float(avg_iv) * 100
             if iv_pct > 40:  # High IV - great premiums
                 premium_score += 20
-                reasons.append(f"✅ High IV ({iv_pct:.1f}%) - excellent premiums")
+                if want_reasons:
+                    reasons.append(f"✅ High IV ({iv_pct:.1f}%) - excellent premiums")
             elif iv_pct > 25:  # Moderate IV
                 premium_score += 15
-                reasons.append(f"✅ Moderate IV ({iv_pct:.1f}%) - good premiums")
+                if want_reasons:
+                    reasons.append(f"✅ Moderate IV ({iv_pct:.1f}%) - good premiums")
             elif iv_pct > 15:  # Low IV
                 premium_score += 8
-                reasons.append(f"↔️ Low IV ({iv_pct:.1f}%) - limited premiums")
+                if want_reasons:
+                    reasons.append(f"↔️ Low IV ({iv_pct:.1f}%) - limited premiums")
             else:  # Very low IV
                 premium_score += 3
-                reasons.append(f"❌ Very low IV ({iv_pct:.1f}%) - poor premiums")
+                if want_reasons:
+                    reasons.append(f"❌ Very low IV ({iv_pct:.1f}%) - poor premiums")
         
         # Check options liquidity for easy entry/exit
         avg_oi = stock.options.filter(
@@ -892,13 +965,16 @@ def calculate_entry_signal(stock):
         if avg_oi:
             if avg_oi > 500:
                 premium_score += 10
-                reasons.append(f"✅ High liquidity (OI: {int(avg_oi)})")
+                if want_reasons:
+                    reasons.append(f"✅ High liquidity (OI: {int(avg_oi)})")
             elif avg_oi > 100:
                 premium_score += 7
-                reasons.append(f"↔️ Moderate liquidity (OI: {int(avg_oi)})")
+                if want_reasons:
+                    reasons.append(f"↔️ Moderate liquidity (OI: {int(avg_oi)})")
             else:
                 premium_score += 3
-                reasons.append(f"⚠️ Low liquidity (OI: {int(avg_oi)})")
+                if want_reasons:
+                    reasons.append(f"⚠️ Low liquidity (OI: {int(avg_oi)})")
     
     score += min(premium_score, 30)
     
@@ -912,28 +988,35 @@ def calculate_entry_signal(stock):
         
         if range_position < 30:  # Lower 30% of range
             context_score += 15
-            reasons.append(f"✅ Near 52-week low ({range_position:.0f}% of range)")
+            if want_reasons:
+                reasons.append(f"✅ Near 52-week low ({range_position:.0f}% of range)")
         elif range_position < 50:  # Lower half
             context_score += 10
-            reasons.append(f"↔️ Below mid-range ({range_position:.0f}% of range)")
+            if want_reasons:
+                reasons.append(f"↔️ Below mid-range ({range_position:.0f}% of range)")
         elif range_position < 70:  # Upper half
             context_score += 5
-            reasons.append(f"⚠️ In upper range ({range_position:.0f}% of range)")
+            if want_reasons:
+                reasons.append(f"⚠️ In upper range ({range_position:.0f}% of range)")
         else:  # Near 52-week high
             context_score += 0
-            reasons.append(f"❌ Near 52-week high ({range_position:.0f}% of range)")
+            if want_reasons:
+                reasons.append(f"❌ Near 52-week high ({range_position:.0f}% of range)")
     
     # Volatility regime check
     if ind.bb_position:
         if ind.bb_position == 'BELOW_LOWER':
             context_score += 5
-            reasons.append("✅ Below lower Bollinger Band - oversold")
+            if want_reasons:
+                reasons.append("✅ Below lower Bollinger Band - oversold")
         elif ind.bb_position == 'MIDDLE':
             context_score += 3
-            reasons.append("↔️ Mid Bollinger Band range")
+            if want_reasons:
+                reasons.append("↔️ Mid Bollinger Band range")
         elif ind.bb_position == 'ABOVE_UPPER':
             context_score += 0
-            reasons.append("❌ Above upper Bollinger Band - overbought")
+            if want_reasons:
+                reasons.append("❌ Above upper Bollinger Band - overbought")
     
     score += min(context_score, 20)
     
@@ -945,12 +1028,14 @@ def calculate_entry_signal(stock):
         distance_to_resistance = ((float(ind.resistance_level_1) - float(stock.last_price)) / float(stock.last_price)) * 100
         if distance_to_resistance < 3:
             risk_penalty += 5
-            reasons.append(f"⚠️ Near resistance ${ind.resistance_level_1} - risk of rejection")
+            if want_reasons:
+                reasons.append(f"⚠️ Near resistance ${ind.resistance_level_1} - risk of rejection")
     
     # Extreme overbought is risky (> 70 per Weekly Wheel Strategy)
     if ind.rsi and ind.rsi > 70:
         risk_penalty += 7
-        reasons.append("⚠️ Overbought (RSI > 70) - avoid selling CSPs!")
+        if want_reasons:
+            reasons.append("⚠️ Overbought (RSI > 70) - avoid selling CSPs!")
     
     score = max(0, score - risk_penalty) + 10  # Add base 10 points
     
@@ -981,7 +1066,7 @@ def calculate_entry_signal(stock):
 
 def export_wheel_scores(request):
     """Export top stocks with wheel scores to CSV"""
-    stocks = Stock.objects.select_related('indicators').prefetch_related('options').all()
+    stocks = Stock.objects.select_related('indicators').annotate(options_updated=Max('options__last_updated')).prefetch_related('options')
     
     stock_scores = []
     for stock in stocks:
@@ -1035,10 +1120,14 @@ def export_wheel_scores(request):
     return response
 
 
+# options_list expiry filter -> max days to expiry
+EXPIRY_DAYS = {'7d': 7, '30d': 30, '60d': 60, '90d': 90}
+
+
 def options_list(request, ticker=None):
     """List options for a ticker with AI analysis"""
     if ticker:
-        stock = get_object_or_404(Stock, ticker=ticker.upper())
+        stock = get_object_or_404(SCORED_STOCK_QS, ticker=ticker.upper())
         
         # Get filter parameters
         expiry_filter = request.GET.get('expiry', 'all')
@@ -1046,7 +1135,7 @@ def options_list(request, ticker=None):
         # Calculate wheel score and entry signal (consistent with screener)
         try:
             wheel_score_data = calculate_wheel_score(stock)
-            entry_signal_data = calculate_entry_signal(stock)
+            entry_signal_data = calculate_entry_signal(stock, want_reasons=False)
             
             stock.ai_analysis = {
                 'wheel_score': wheel_score_data['total_score'],
@@ -1090,15 +1179,9 @@ def options_list(request, ticker=None):
         options = Option.objects.filter(stock=stock, option_type='PUT')
         
         # Apply expiry filter
-        today = timezone.now().date()
-        if expiry_filter == '7d':
-            options = options.filter(expiry_date__lte=today + timezone.timedelta(days=7))
-        elif expiry_filter == '30d':
-            options = options.filter(expiry_date__lte=today + timezone.timedelta(days=30))
-        elif expiry_filter == '60d':
-            options = options.filter(expiry_date__lte=today + timezone.timedelta(days=60))
-        elif expiry_filter == '90d':
-            options = options.filter(expiry_date__lte=today + timezone.timedelta(days=90))
+        if expiry_filter in EXPIRY_DAYS:
+            today = timezone.now().date()
+            options = options.filter(expiry_date__lte=today + timezone.timedelta(days=EXPIRY_DAYS[expiry_filter]))
         
         options = options.order_by('expiry_date', 'strike')
     else:
@@ -1116,109 +1199,155 @@ def options_list(request, ticker=None):
 def signals_list(request):
     """List all signals with quality scores"""
     signals = Signal.objects.select_related('stock').order_by('-quality_score', '-generated_at')
+    page_obj = Paginator(signals, 50).get_page(request.GET.get('page'))
     # Get stocks for timestamp display
     stocks = Stock.objects.order_by('-last_updated')[:1]
-    return render(request, 'ibkr/signals.html', {'signals': signals, 'stocks': stocks})
+    return render(request, 'ibkr/signals.html', {
+        'signals': page_obj.object_list,
+        'page_obj': page_obj,
+        'stocks': stocks,
+    })
 
 
-def discovery(request):
-    """Discover wheel strategy opportunities with recommended entry strikes"""
-    # Get filter parameters
-    min_score = int(request.GET.get('min_score', 0))
-    rsi_signal = request.GET.get('rsi_signal', 'all')
-    trend = request.GET.get('trend', 'all')
-    
-    # Get all stocks with indicators
-    stocks = Stock.objects.select_related('indicators').exclude(last_price__isnull=True)
+def _build_discovery_opportunities(min_score, rsi_signal, trend):
+    """Score every priced stock for discovery() and return opportunities, best first."""
+    # Load only the columns scoring reads (near_support/near_resistance need every
+    # level). The wheel score depends on Stock fundamentals and price as well as the
+    # indicators, so it is scored live below rather than filtered on a stored value.
+    # last_price > 0 also drops NULLs; a zero price would divide by zero in the strike math
+    stocks = Stock.objects.select_related('indicators').filter(last_price__gt=0)
+    if rsi_signal != 'all':
+        stocks = stocks.filter(indicators__rsi_signal=rsi_signal)
+    if trend != 'all':
+        stocks = stocks.filter(indicators__ema_trend=trend)
+    stocks = stocks.only(
+        'ticker', 'name', 'last_price', 'dividend_yield', 'beta', 'avg_volume', 'market_cap',
+        'indicators__rsi', 'indicators__rsi_signal', 'indicators__ema_trend', 'indicators__bb_position',
+        'indicators__support_level_1', 'indicators__support_level_2', 'indicators__support_level_3',
+        'indicators__resistance_level_1', 'indicators__resistance_level_2', 'indicators__resistance_level_3',
+    )
     
-    opportunities = []
+    # First pass: AI analysis per stock; strike math is done below in one vectorized pass
+    candidates = []
+    current_prices = []
+    supports = []
     
-    for stock in stocks:
+    # Stream rows instead of caching the whole universe; only candidates are kept
+    for stock in stocks.iterator(chunk_size=200):
         try:
             # Get indicators
             indicator = stock.indicators
             
-            # Apply filters
-            if rsi_signal != 'all' and indicator.rsi_signal != rsi_signal:
-                continue
-            if trend != 'all' and indicator.ema_trend != trend:
-                continue
-            
-            # Get AI analysis
-            analysis = AIAnalyzer.get_wheel_strategy_analysis(stock)
-            
-            # Filter by minimum score
+            # Get AI analysis (indicator already joined above — no re-lookup)
+            analysis = AIAnalyzer.get_wheel_strategy_analysis(stock, indicator=indicator)
             if analysis['wheel_score'] < min_score:
                 continue
             
-            # Calculate recommended entry strikes
             current_price = float(stock.last_price)
             support = float(indicator.support_level_1) if indicator.support_level_1 else current_price * 0.95
-            
-            recommended_strikes = []
-            
+        except Exception as e:
+            # Skip stocks without indicators
+            continue
+        
+        candidates.append((stock, indicator, analysis))
+        current_prices.append(current_price)
+        supports.append(support)
+    
+    if not candidates:
+        return []
+    
+    # Calculate recommended entry strikes for all candidates at once
+    price_arr = np.array(current_prices)
+    support_arr = np.array(supports)
+    strike1_arr = np.round(support_arr * 0.98, 2)  # Slightly below support
+    discount1_arr = np.round((price_arr - strike1_arr) / price_arr * 100, 1)
+    strike2_arr = np.round(price_arr * 0.95, 2)  # 5% below current
+    strike3_arr = np.round(price_arr * 0.90, 2)  # 10% below current
+    gap2_arr = np.abs(strike2_arr - support_arr)
+    gap3_arr = np.abs(strike3_arr - support_arr)
+    
+    opportunities = []
+    for (stock, indicator, analysis), current_price, support, strike1, discount1, strike2, strike3, gap2, gap3 in zip(
+        candidates, current_prices, supports,
+        strike1_arr.tolist(), discount1_arr.tolist(), strike2_arr.tolist(),
+        strike3_arr.tolist(), gap2_arr.tolist(), gap3_arr.tolist(),
+    ):
+        recommended_strikes = [
             # Strike 1: At support (Optimal for wheel - best entry)
-            strike1 = round(support * 0.98, 2)  # Slightly below support
-            discount1 = ((current_price - strike1) / current_price) * 100
-            recommended_strikes.append({
+            {
                 'price': strike1,
                 'vs_support': f'${support:.2f}',
-                'discount_pct': round(discount1, 1),
+                'discount_pct': discount1,
                 'target_delta': '0.30',
                 'quality': 'optimal',
                 'reasoning': 'At support level - Ideal for assignment with safety margin'
-            })
-            
+            },
             # Strike 2: 5% below current (Conservative)
-            strike2 = round(current_price * 0.95, 2)
-            discount2 = 5.0
-            recommended_strikes.append({
+            {
                 'price': strike2,
-                'vs_support': f'${abs(strike2 - support):.2f} {"above" if strike2 > support else "below"}',
-                'discount_pct': round(discount2, 1),
+                'vs_support': f'${gap2:.2f} {"above" if strike2 > support else "below"}',
+                'discount_pct': 5.0,
                 'target_delta': '0.25-0.30',
                 'quality': 'good',
                 'reasoning': 'Conservative entry - Good premium with lower assignment risk'
-            })
-            
+            },
             # Strike 3: 10% below current (Aggressive)
-            strike3 = round(current_price * 0.90, 2)
-            discount3 = 10.0
-            recommended_strikes.append({
+            {
                 'price': strike3,
-                'vs_support': f'${abs(strike3 - support):.2f} {"above" if strike3 > support else "below"}',
-                'discount_pct': round(discount3, 1),
+                'vs_support': f'${gap3:.2f} {"above" if strike3 > support else "below"}',
+                'discount_pct': 10.0,
                 'target_delta': '0.15-0.20',
                 'quality': 'good',
                 'reasoning': 'Aggressive discount - Lower premium but excellent entry if assigned'
-            })
-            
-            # Build opportunity object
-            opportunity = {
-                'ticker': stock.ticker,
-                'name': stock.name or stock.ticker,
-                'price': stock.last_price,
-                'wheel_score': analysis['wheel_score'],
-                'grade': 'A' if analysis['wheel_score'] >= 80 else 'B' if analysis['wheel_score'] >= 60 else 'C',
-                'rsi': indicator.rsi,
-                'rsi_signal': indicator.rsi_signal,
-                'trend': indicator.ema_trend,
-                'support': support,
-                'resistance': indicator.resistance_level_1 or current_price * 1.05,
-                'near_support': indicator.near_support,
-                'price_vs_resistance': f'${abs(current_price - float(indicator.resistance_level_1 or 0)):.2f} below' if indicator.resistance_level_1 else '—',
-                'recommended_strikes': recommended_strikes,
-                'strategy_recommendation': analysis['reasoning']
-            }
-            
-            opportunities.append(opportunity)
-            
-        except Exception as e:
-            # Skip stocks without indicators
-            continue
+            },
+        ]
+        
+        # Build opportunity object
+        opportunity = {
+            'ticker': stock.ticker,
+            'name': stock.name or stock.ticker,
+            'price': stock.last_price,
+            'wheel_score': analysis['wheel_score'],
+            'grade': 'A' if analysis['wheel_score'] >= 80 else 'B' if analysis['wheel_score'] >= 60 else 'C',
+            'rsi': indicator.rsi,
+            'rsi_signal': indicator.rsi_signal,
+            'trend': indicator.ema_trend,
+            'support': support,
+            'resistance': indicator.resistance_level_1 or current_price * 1.05,
+            'near_support': indicator.near_support,
+            'price_vs_resistance': f'${abs(current_price - float(indicator.resistance_level_1 or 0)):.2f} below' if indicator.resistance_level_1 else '—',
+            'recommended_strikes': recommended_strikes,
+            'strategy_recommendation': analysis['reasoning']
+        }
+        
+        opportunities.append(opportunity)
     
-    # Sort by wheel score
+    # Best first, ranked on the same live score that is displayed
     opportunities.sort(key=lambda x: x['wheel_score'], reverse=True)
+    return opportunities
+
+
+def discovery(request):
+    """Discover wheel strategy opportunities with recommended entry strikes"""
+    # Get filter parameters
+    min_score = int(request.GET.get('min_score', 0))
+    rsi_signal = request.GET.get('rsi_signal', 'all')
+    trend = request.GET.get('trend', 'all')
+    
+    # Results only change when stock data or indicators are refreshed, so the
+    # newest timestamps of each act as the cache buster
+    latest = Stock.objects.aggregate(
+        stock_ts=Max('last_updated'),
+        indicator_ts=Max('indicators__last_calculated'),
+    )
+    stock_ts = latest['stock_ts'].timestamp() if latest['stock_ts'] else 0
+    indicator_ts = latest['indicator_ts'].timestamp() if latest['indicator_ts'] else 0
+    cache_key = f"discovery_{min_score}_{rsi_signal}_{trend}_{stock_ts}_{indicator_ts}"
+    opportunities = cache.get_or_set(
+        cache_key,
+        lambda: _build_discovery_opportunities(min_score, rsi_signal, trend),
+        timeout=60,
+    )
     
     return render(request, 'ibkr/discovery.html', {
         'opportunities': opportunities,
@@ -1228,9 +1357,19 @@ def discovery(request):
     })
 
 
+# (score key, minimum score, label) for the wheel signals shown on stock_detail
+WHEEL_SIGNAL_RULES = (
+    ('volatility_score', 20, "✅ High IV ({:.0f}/25) - Great premiums"),
+    ('liquidity_score', 15, "✅ High liquidity ({:.0f}/20) - Easy entry/exit"),
+    ('technical_score', 18, "✅ Strong technicals ({:.0f}/25)"),
+    ('stability_score', 14, "✅ Good stability ({:.0f}/20)"),
+    ('price_score', 8, "✅ Ideal price ({:.0f}/10) - $10-$50 range"),
+)
+
+
 def stock_detail(request, ticker):
     """Detailed view for a single stock"""
-    stock = get_object_or_404(Stock, ticker=ticker.upper())
+    stock = get_object_or_404(SCORED_STOCK_QS, ticker=ticker.upper())
     
     # Get wheel score and entry signal (consistent with screener)
     try:
@@ -1262,7 +1401,11 @@ def stock_detail(request, ticker):
             'reasoning': f"{entry_signal_data['signal']} - {entry_signal_data['quality']} quality entry",
             
             # Wheel signals from breakdown
-            'wheel_signals': [],
+            'wheel_signals': [
+                template.format(wheel_score_data[key])
+                for key, threshold, template in WHEEL_SIGNAL_RULES
+                if wheel_score_data[key] >= threshold
+            ],
             'signals': [],  # Technical signals placeholder
             
             # Action and confidence
@@ -1270,18 +1413,6 @@ def stock_detail(request, ticker):
             'confidence': entry_signal_data['score']
         }
         
-        # Add wheel signals based on score breakdown
-        if wheel_score_data['volatility_score'] >= 20:
-            analysis['wheel_signals'].append(f"✅ High IV ({wheel_score_data['volatility_score']:.0f}/25) - Great premiums")
-        if wheel_score_data['liquidity_score'] >= 15:
-            analysis['wheel_signals'].append(f"✅ High liquidity ({wheel_score_data['liquidity_score']:.0f}/20) - Easy entry/exit")
-        if wheel_score_data['technical_score'] >= 18:
-            analysis['wheel_signals'].append(f"✅ Strong technicals ({wheel_score_data['technical_score']:.0f}/25)")
-        if wheel_score_data['stability_score'] >= 14:
-            analysis['wheel_signals'].append(f"✅ Good stability ({wheel_score_data['stability_score']:.0f}/20)")
-        if wheel_score_data['price_score'] >= 8:
-            analysis['wheel_signals'].append(f"✅ Ideal price ({wheel_score_data['price_score']:.0f}/10) - $10-$50 range")
-        
         # Calculate average weekly premium (7-14 DTE)
         weekly_premium_avg = None
         weekly_premium_apy = None
@@ -1301,31 +1432,31 @@ def stock_detail(request, ticker):
                 bid__gt=0
             )
             
-            # Apply delta filter if available
-            weekly_with_delta = weekly_options.filter(
-                delta__isnull=False,
-                delta__gte=-0.40,
-                delta__lte=-0.20
+            # Ideal wheel delta range; aggregated alongside the unfiltered set
+            # so both candidates come back from a single query
+            in_delta_range = Q(delta__isnull=False, delta__gte=-0.40, delta__lte=-0.20)
+            # Calculate mid_price as (bid + ask) / 2 in the database
+            calc_mid_price = ExpressionWrapper(
+                (F('bid') + F('ask')) / 2.0,
+                output_field=FloatField()
+            )
+            weekly_stats = weekly_options.aggregate(
+                avg_delta=Avg(calc_mid_price, filter=in_delta_range),
+                cnt_delta=Count('id', filter=in_delta_range),
+                avg_all=Avg(calc_mid_price),
+                cnt_all=Count('id'),
             )
             
             # Use delta-filtered options if available, otherwise use all weekly options
-            options_to_use = weekly_with_delta if weekly_with_delta.exists() else weekly_options
+            if weekly_stats['cnt_delta']:
+                avg_premium, weekly_options_count = weekly_stats['avg_delta'], weekly_stats['cnt_delta']
+            else:
+                avg_premium, weekly_options_count = weekly_stats['avg_all'], weekly_stats['cnt_all']
             
-            if options_to_use.exists():
-                from django.db.models import F, ExpressionWrapper, FloatField
-                # Calculate mid_price as (bid + ask) / 2 in the database
-                options_with_mid = options_to_use.annotate(
-                    calc_mid_price=ExpressionWrapper(
-                        (F('bid') + F('ask')) / 2.0,
-                        output_field=FloatField()
-                    )
-                )
-                avg_premium = options_with_mid.aggregate(Avg('calc_mid_price'))['calc_mid_price__avg']
-                weekly_options_count = options_to_use.count()
-                if avg_premium and stock.last_price:
-                    weekly_premium_avg = float(avg_premium)
-                    # Calculate APY for weekly premium
-                    weekly_premium_apy = (weekly_premium_avg / float(stock.last_price)) * (365 / 7) * 100
+            if avg_premium and stock.last_price:
+                weekly_premium_avg = float(avg_premium)
+                # Calculate APY for weekly premium
+                weekly_premium_apy = (weekly_premium_avg / float(stock.last_price)) * (365 / 7) * 100
         except Exception as e:
             print(f"Error calculating weekly premium for {stock.ticker}: {e}")
             pass
@@ -1401,14 +1532,17 @@ def stock_detail(request, ticker):
     signals = []
     try:
         # Get PUT options for this stock sorted by DTE (nearest first)
-        # Note: mid_price is a @property, cannot filter in DB query
-        all_puts = Option.objects.filter(
+        # dte/mid_price are @properties, so filter on the columns behind them:
+        # 14-60 DTE as an expiry window, a usable quote, and a wheel delta (0.20-0.40)
+        today = timezone.now().date()
+        candidate_puts = list(Option.objects.filter(
+            Q(bid__gt=0, ask__gt=0) | Q(last__gt=0),
+            Q(delta__gte=-0.40, delta__lte=-0.20) | Q(delta__gte=0.20, delta__lte=0.40),
             stock=stock,
             option_type='PUT',
-        ).order_by('expiry_date')  # Sort by expiry (nearest first) not IV
-        
-        # Filter in Python for DTE range and valid mid_price - get up to 20 to ensure we catch good deltas
-        candidate_puts = [p for p in all_puts if p.dte and 14 <= p.dte <= 60 and p.mid_price and p.delta][:20]
+            expiry_date__gte=today + timezone.timedelta(days=14),
+            expiry_date__lte=today + timezone.timedelta(days=60),
+        ).order_by('expiry_date')[:20])  # Sort by expiry (nearest first) not IV
         
         best_entry_trade = None
         best_apy = 0
@@ -1527,6 +1661,23 @@ def watchlist_remove(request, ticker):
     return redirect('ibkr:dashboard')
 
 
+# Stock columns overwritten when refresh_watchlist_data upserts fresh data
+WATCHLIST_REFRESH_FIELDS = [
+    'name', 'last_price', 'market_cap', 'beta', 'roe', 'free_cash_flow',
+    'sector', 'industry', 'pe_ratio', 'forward_pe', 'dividend_yield',
+    'fifty_two_week_high', 'fifty_two_week_low', 'avg_volume', 'last_updated',
+]
+
+
+def _fetch_watchlist_stock(ticker):
+    """Fetch one ticker for refresh_watchlist_data; returns (ticker, data, error)"""
+    try:
+        return ticker, StockDataFetcher.fetch_stock_data(ticker), None
+    except Exception as e:
+        logger.error(f"Error fetching {ticker}: {e}", exc_info=True)
+        return ticker, None, e
+
+
 def refresh_watchlist_data(request):
     """Refresh stock data for all watchlist tickers"""
     watchlist = Watchlist.objects.all()
@@ -1546,40 +1697,67 @@ def refresh_watchlist_data(request):
     error_count = 0
     error_details = []
     
-    for ticker in tickers:
+    # yfinance calls are network-bound, so fetch every ticker concurrently
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(_fetch_watchlist_stock, tickers))
+    
+    stocks = []
+    for ticker, stock_data, error in results:
+        if error:
+            error_count += 1
+            error_details.append(f"{ticker}: {str(error)}")
+            logger.error(f"Error refreshing {ticker}: {error}")
+        elif stock_data:
+            stocks.append(Stock(
+                ticker=ticker,
+                name=stock_data.get('name', ''),
+                last_price=stock_data.get('last_price'),
+                market_cap=stock_data.get('market_cap'),
+                beta=stock_data.get('beta'),
+                roe=stock_data.get('roe'),
+                free_cash_flow=stock_data.get('free_cash_flow'),
+                sector=stock_data.get('sector', ''),
+                industry=stock_data.get('industry', ''),
+                pe_ratio=stock_data.get('pe_ratio'),
+                forward_pe=stock_data.get('forward_pe'),
+                dividend_yield=stock_data.get('dividend_yield'),
+                fifty_two_week_high=stock_data.get('fifty_two_week_high'),
+                fifty_two_week_low=stock_data.get('fifty_two_week_low'),
+                avg_volume=stock_data.get('avg_volume'),
+                last_updated=stock_data.get('last_updated'),
+            ))
+            success_count += 1
+            logger.info(f"Successfully refreshed {ticker}: ${stock_data.get('last_price', 0):.2f}")
+        else:
+            error_count += 1
+            error_details.append(f"{ticker}: No data returned")
+            logger.warning(f"Failed to fetch data for {ticker}: No data returned")
+    
+    # Upsert every refreshed stock in one statement, in a single transaction
+    if stocks:
         try:
-            stock_data = StockDataFetcher.fetch_stock_data(ticker)
-            if stock_data:
-                Stock.objects.update_or_create(
-                    ticker=ticker,
-                    defaults={
-                        'name': stock_data.get('name', ''),
-                        'last_price': stock_data.get('last_price'),
-                        'market_cap': stock_data.get('market_cap'),
-                        'beta': stock_data.get('beta'),
-                        'roe': stock_data.get('roe'),
-                        'free_cash_flow': stock_data.get('free_cash_flow'),
-                        'sector': stock_data.get('sector', ''),
-                        'industry': stock_data.get('industry', ''),
-                        'pe_ratio': stock_data.get('pe_ratio'),
-                        'forward_pe': stock_data.get('forward_pe'),
-                        'dividend_yield': stock_data.get('dividend_yield'),
-                        'fifty_two_week_high': stock_data.get('fifty_two_week_high'),
-                        'fifty_two_week_low': stock_data.get('fifty_two_week_low'),
-                        'avg_volume': stock_data.get('avg_volume'),
-                        'last_updated': stock_data.get('last_updated'),
-                    }
+            with transaction.atomic():
+                Stock.objects.bulk_create(
+                    stocks,
+                    update_conflicts=True,
+                    unique_fields=['ticker'],
+                    update_fields=WATCHLIST_REFRESH_FIELDS,
                 )
-                success_count += 1
-                logger.info(f"Successfully refreshed {ticker}: ${stock_data.get('last_price', 0):.2f}")
-            else:
-                error_count += 1
-                error_details.append(f"{ticker}: No data returned")
-                logger.warning(f"Failed to fetch data for {ticker}: No data returned")
-        except Exception as e:
-            error_count += 1
-            error_details.append(f"{ticker}: {str(e)}")
-            logger.error(f"Error refreshing {ticker}: {e}", exc_info=True)
+        except DatabaseError as e:
+            # One bad row (e.g. an overflowing DecimalField) fails the batch; save row by row
+            # so the rest still land and the failing tickers are reported
+            logger.warning(f"Bulk watchlist upsert failed ({e}), retrying per ticker")
+            for stock in stocks:
+                try:
+                    Stock.objects.update_or_create(
+                        ticker=stock.ticker,
+                        defaults={field: getattr(stock, field) for field in WATCHLIST_REFRESH_FIELDS},
+                    )
+                except DatabaseError as row_error:
+                    success_count -= 1
+                    error_count += 1
+                    error_details.append(f"{stock.ticker}: {str(row_error)}")
+                    logger.error(f"Error saving {stock.ticker}: {row_error}")
     
     if success_count > 0:
         messages.success(request, f'✅ Refreshed {success_count} stock(s) successfully')
@@ -1595,24 +1773,85 @@ def refresh_watchlist_data(request):
 
 
 def sync_yfinance_options_view(request):
-    """Sync options data from Yahoo Finance for all stocks"""
-    from django.core.management import call_command
-    from io import StringIO
+    """Start a background options sync from Yahoo Finance (all stocks, or ?ticker=)"""
+    ticker = request.GET.get('ticker', '').upper().strip()
+    # The options page triggers this via fetch (POST) and polls for status;
+    # plain links get a flash message and a redirect back
+    wants_json = request.method == 'POST'
+    
+    # Atomically claim the sync (cache.add only succeeds if no sync holds the lock)
+    if not cache.add('yfinance_sync_lock', '1', timeout=3600):
+        if wants_json:
+            return JsonResponse({
+                'success': False,
+                'message': 'Options sync already in progress',
+                'status': 'running',
+            })
+        messages.info(request, 'Options sync already in progress')
+        return redirect(request.META.get('HTTP_REFERER', '/'))
     
-    try:
-        # Capture command output
-        out = StringIO()
-        call_command('sync_yfinance_options', stdout=out)
-        
-        messages.success(request, 'Options data synced from Yahoo Finance successfully!')
-    except Exception as e:
-        messages.error(request, f'Error syncing options: {str(e)}')
+    def run_sync():
+        output = RingBufferWriter()
+        try:
+            if ticker:
+                call_command('sync_yfinance_options', ticker=ticker, stdout=output)
+            else:
+                call_command('sync_yfinance_options', stdout=output)
+            cache.set('yfinance_sync_status', 'completed', timeout=300)
+            cache.set('yfinance_sync_output', output.getvalue(), timeout=300)
+        except Exception as e:
+            cache.set('yfinance_sync_status', 'error', timeout=300)
+            cache.set('yfinance_sync_error', str(e), timeout=300)
+        finally:
+            cache.delete('yfinance_sync_lock')
+            # Pool threads outlive the job; don't leave a persistent DB connection behind
+            connection.close()
+    
+    cache.set_many({
+        'yfinance_sync_status': 'running',
+        'yfinance_sync_started': timezone.now().isoformat(),
+    }, timeout=3600)
+    
+    _BACKGROUND_POOL.submit(run_sync)
+    
+    if wants_json:
+        return JsonResponse({
+            'success': True,
+            'message': 'Options sync started',
+            'status': 'running',
+        })
+    
+    messages.success(request, 'Options sync from Yahoo Finance started - data will update shortly.')
     
     # Redirect back to options page or referer
     referer = request.META.get('HTTP_REFERER', '/')
     return redirect(referer)
 
 
+def sync_yfinance_options_status_api(request):
+    """API endpoint to check Yahoo Finance options sync status"""
+    state = cache.get_many(['yfinance_sync_status', 'yfinance_sync_started', 'yfinance_sync_output', 'yfinance_sync_error'])
+    status = state.get('yfinance_sync_status', 'idle')
+    
+    response = {
+        'status': status,
+        'started': state.get('yfinance_sync_started'),
+    }
+    
+    if status == 'completed':
+        response['message'] = 'Options data synced from Yahoo Finance successfully!'
+        response['output'] = state.get('yfinance_sync_output', '')
+    elif status == 'error':
+        response['error'] = state.get('yfinance_sync_error', '')
+        response['message'] = 'Options sync failed'
+    elif status == 'running':
+        response['message'] = 'Syncing options from Yahoo Finance...'
+    else:
+        response['message'] = 'No sync in progress'
+    
+    return JsonResponse(response)
+
+
 def open_position(request):
     """Open a new option position"""
     if request.method == 'POST':
@@ -1668,19 +1907,36 @@ def open_position(request):
     return redirect('ibkr:dashboard')
 
 
+# OptionPosition.current_premium is a DecimalField(decimal_places=2)
+PREMIUM_QUANT = Decimal('0.01')
+
+
 def positions_list(request):
     """List all option positions with AI recommendations"""
-    open_positions = OptionPosition.objects.filter(status='OPEN').select_related('stock', 'option')
+    open_positions = list(OptionPosition.objects.filter(status='OPEN').select_related('stock__indicators', 'option'))
     closed_positions = OptionPosition.objects.exclude(status='OPEN').select_related('stock', 'option')[:10]
     
-    # Update current premium for open positions
+    # Update current premium for open positions — only rows whose premium moved,
+    # written back in one batched UPDATE
+    changed = []
+    now = timezone.now()  # bulk_update skips auto_now, so updated_at is set by hand
+    analysis_by_stock = {}  # AIAnalyzer runs lazily, at most once per stock across its positions
     for position in open_positions:
         if position.option and position.option.mid_price:
-            position.current_premium = position.option.mid_price
-            position.save()
+            # Compare at the field's precision so an unchanged premium isn't rewritten
+            mid_price = Decimal(str(position.option.mid_price)).quantize(PREMIUM_QUANT)
+            if position.current_premium != mid_price:
+                position.current_premium = mid_price
+                position.updated_at = now
+                changed.append(position)
         
         # Add AI recommendation
-        position.ai_recommendation = get_position_ai_recommendation(position)
+        position.ai_recommendation = get_position_ai_recommendation(
+            position, analysis_cache=analysis_by_stock
+        )
+    
+    if changed:
+        OptionPosition.objects.bulk_update(changed, ['current_premium', 'updated_at'], batch_size=200)
     
     context = {
         'open_positions': open_positions,
@@ -1707,20 +1963,21 @@ def close_position(request, position_id):
     return redirect('ibkr:positions')
 
 
-def get_position_ai_recommendation(position):
-    """Generate AI recommendation for a position"""
+def get_position_ai_recommendation(position, analysis_cache=None):
+    """Generate AI recommendation for a position.
+
+    The stock's wheel analysis is only computed for losing positions. Pass an
+    analysis_cache dict (keyed by ticker) to share it across positions on the
+    same stock.
+    """
     stock = position.stock
     dte = position.dte
     days_held = position.days_held
+    last_price = stock.last_price
+    strike = position.strike
     
     # Get current P/L
-    if position.unrealized_pl is not None:
-        unrealized_pl_pct = position.unrealized_pl_pct
-    else:
-        unrealized_pl_pct = 0
-    
-    # Get stock analysis
-    ai_analysis = AIAnalyzer.get_wheel_strategy_analysis(stock)
+    unrealized_pl_pct = position.unrealized_pl_pct or 0
     
     recommendation = {
         'action': '',
@@ -1743,6 +2000,13 @@ def get_position_ai_recommendation(position):
         recommendation['color'] = 'green'
     
     elif unrealized_pl_pct <= -20:
+        # Get stock analysis - only this branch needs it
+        ai_analysis = analysis_cache.get(stock.ticker) if analysis_cache is not None else None
+        if ai_analysis is None:
+            ai_analysis = AIAnalyzer.get_wheel_strategy_analysis(stock)
+            if analysis_cache is not None:
+                analysis_cache[stock.ticker] = ai_analysis
+        
         if ai_analysis and ai_analysis.get('action') == 'buy':
             recommendation['action'] = 'HOLD - Technical Support'
             recommendation['reason'] = f'Down {abs(unrealized_pl_pct):.1f}%, but stock shows bullish signals. Consider rolling down if assigned.'
@@ -1755,9 +2019,9 @@ def get_position_ai_recommendation(position):
             recommendation['color'] = 'red'
     
     elif dte <= 3:
-        if position.option_type == 'PUT' and stock.last_price and float(stock.last_price) > float(position.strike):
+        if position.option_type == 'PUT' and last_price and float(last_price) > float(strike):
             recommendation['action'] = 'LET EXPIRE'
-            recommendation['reason'] = f'Stock at ${stock.last_price} above strike ${position.strike}. Will expire worthless - keep premium.'
+            recommendation['reason'] = f'Stock at ${last_price} above strike ${strike}. Will expire worthless - keep premium.'
             recommendation['confidence'] = 95
             recommendation['color'] = 'green'
         else:
@@ -1795,8 +2059,6 @@ def health_check(request):
 
     # AJAX support: return JSON for XHR requests
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-        from django.http import JsonResponse
-        import json
         return JsonResponse(results, safe=False, json_dumps_params={'default': str})
 
     # Convert timestamp to Abu Dhabi time (UTC+4) for display
@@ -1820,7 +2082,7 @@ def health_check(request):
 
 def gateway_control(request):
     """IB Gateway control panel - unified API status + VNC login"""
-    client = IBKRClient()
+    client = get_client()
     is_connected = client.ensure_connected()
 
     import os
@@ -1850,7 +2112,7 @@ def gateway_control(request):
 def account_summary_api(request):
     """JSON API: fetch live IBKR account summary for async page loading."""
     try:
-        client = IBKRClient()
+        client = get_client()
         if not client.ensure_connected():
             return JsonResponse({'connected': False, 'error': 'Not connected to IBKR Gateway'})
         raw = client.get_account_summary() or {}
@@ -1881,7 +2143,7 @@ def account_summary_api(request):
 
 def gateway_status_api(request):
     """API endpoint for gateway connection status — passive check only, no reconnect attempt."""
-    client = IBKRClient()
+    client = get_client()
     
     try:
         is_connected = client.is_connected()   # does NOT try to reconnect
@@ -1916,7 +2178,7 @@ def gateway_connect_api(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST method required'}, status=405)
     
-    client = IBKRClient()
+    client = get_client()
     
     try:
         success = client.connect()
@@ -1946,10 +2208,8 @@ def gateway_disconnect_api(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST method required'}, status=405)
     
-    client = IBKRClient()
-    
     try:
-        client.disconnect()
+        reset_client()
         return JsonResponse({
             'success': True,
             'message': 'Disconnected from IB Gateway',
@@ -1967,10 +2227,6 @@ def discover_stocks_api(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST method required'}, status=405)
 
-    from django.core.management import call_command
-    from io import StringIO
-    import json
-
     try:
         body = json.loads(request.body) if request.body else {}
         preset = body.get('preset', 'popular')
@@ -2000,38 +2256,13 @@ def refresh_all_data_api(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST method required'}, status=405)
     
-    from django.core.management import call_command
-    from io import StringIO
-    import sys
-    import json
-    
     try:
         # Get refresh mode from request
         body = json.loads(request.body) if request.body else {}
         mode = body.get('mode', 'quick')  # 'quick' or 'full'
         
-        # Capture command output
-        output = StringIO()
-        
-        # Run refresh in a separate thread to avoid blocking
-        import threading
-        
-        def run_refresh():
-            try:
-                if mode == 'quick':
-                    # Quick refresh - only stale data
-                    call_command('quick_refresh', stdout=output, stderr=output)
-                else:
-                    # Full refresh - everything
-                    call_command('refresh_all_data', stdout=output, stderr=output)
-                cache.set('refresh_status', 'completed', timeout=300)
-                cache.set('refresh_output', output.getvalue(), timeout=300)
-            except Exception as e:
-                cache.set('refresh_status', 'error', timeout=300)
-                cache.set('refresh_error', str(e), timeout=300)
-        
-        # Check if refresh is already running
-        if cache.get('refresh_status') == 'running':
+        # Atomically claim the refresh (cache.add only succeeds if no refresh holds the lock)
+        if not cache.add('refresh_lock', '1', timeout=3600):
             return JsonResponse({
                 'success': False,
                 'error': 'Refresh already in progress',
@@ -2039,12 +2270,33 @@ def refresh_all_data_api(request):
             })
         
         # Start refresh
-        cache.set('refresh_status', 'running', timeout=3600)
-        cache.set('refresh_started', timezone.now().isoformat(), timeout=3600)
-        
-        thread = threading.Thread(target=run_refresh)
-        thread.daemon = True
-        thread.start()
+        cache.set_many({
+            'refresh_status': 'running',
+            'refresh_started': timezone.now().isoformat(),
+        }, timeout=3600)
+        
+        def store_stats():
+            # Count once at completion so status polls don't re-run COUNT(*)s
+            cache.set('refresh_stats', {
+                'stocks': Stock.objects.count(),
+                'indicators': StockIndicator.objects.count(),
+                'options': Option.objects.count(),
+            }, timeout=300)
+        
+        # Run refresh in a separate process to avoid blocking the web workers
+        try:
+            start_command_process(
+                # Quick refresh - only stale data; full refresh - everything
+                'quick_refresh' if mode == 'quick' else 'refresh_all_data',
+                'refresh',
+                progress_key='refresh_progress',
+                on_complete=store_stats,
+                lock_key='refresh_lock',
+            )
+        except Exception:
+            cache.delete('refresh_lock')
+            cache.set('refresh_status', 'error', timeout=300)
+            raise
         
         return JsonResponse({
             'success': True,
@@ -2063,11 +2315,15 @@ def refresh_all_data_api(request):
 
 def refresh_status_api(request):
     """API endpoint to check refresh status"""
-    status = cache.get('refresh_status', 'idle')
-    started = cache.get('refresh_started')
-    output = cache.get('refresh_output', '')
-    error = cache.get('refresh_error', '')
-    progress = cache.get('refresh_progress', {})
+    state = cache.get_many([
+        'refresh_status', 'refresh_started', 'refresh_output', 'refresh_error',
+        'refresh_progress', 'refresh_stats',
+    ])
+    status = state.get('refresh_status', 'idle')
+    started = state.get('refresh_started')
+    output = state.get('refresh_output', '')
+    error = state.get('refresh_error', '')
+    progress = state.get('refresh_progress', {})
     
     response = {
         'status': status,
@@ -2078,13 +2334,8 @@ def refresh_status_api(request):
     if status == 'completed':
         response['message'] = 'Data refresh completed successfully'
         response['output'] = output
-        # Get updated stats
-        from .models import Stock, StockIndicator, Option
-        response['stats'] = {
-            'stocks': Stock.objects.count(),
-            'indicators': StockIndicator.objects.count(),
-            'options': Option.objects.count(),
-        }
+        # Updated stats, counted once when the refresh finished
+        response['stats'] = state.get('refresh_stats', {})
     elif status == 'error':
         response['error'] = error
         response['message'] = 'Data refresh failed'
@@ -2110,42 +2361,37 @@ def sync_positions_api(request):
     if request.method != 'POST':
         return JsonResponse({'error': 'POST method required'}, status=405)
     
-    from django.core.management import call_command
-    from io import StringIO
-    import threading
-    
     try:
-        # Check if sync is already running
-        if cache.get('sync_positions_status') == 'running':
+        # Atomically claim the sync (cache.add only succeeds if no sync holds the lock)
+        if not cache.add('sync_positions_lock', '1', timeout=600):
             return JsonResponse({
                 'success': False,
                 'error': 'Position sync already in progress',
                 'status': 'running'
             })
         
-        # Capture command output
-        output = StringIO()
-        
-        def run_sync():
-            try:
-                call_command('sync_positions', stdout=output, stderr=output)
-                cache.set('sync_positions_status', 'completed', timeout=300)
-                cache.set('sync_positions_output', output.getvalue(), timeout=300)
-                
-                # Store position counts
-                from .models import OptionPosition
-                cache.set('sync_positions_count', OptionPosition.objects.filter(status='OPEN').count(), timeout=300)
-            except Exception as e:
-                cache.set('sync_positions_status', 'error', timeout=300)
-                cache.set('sync_positions_error', str(e), timeout=300)
-        
         # Start sync
-        cache.set('sync_positions_status', 'running', timeout=600)
-        cache.set('sync_positions_started', timezone.now().isoformat(), timeout=600)
+        cache.set_many({
+            'sync_positions_status': 'running',
+            'sync_positions_started': timezone.now().isoformat(),
+        }, timeout=600)
         
-        thread = threading.Thread(target=run_sync)
-        thread.daemon = True
-        thread.start()
+        def store_open_count():
+            # Store position counts
+            cache.set('sync_positions_count', OptionPosition.objects.filter(status='OPEN').count(), timeout=300)
+        
+        # sync_positions connects with its own random clientId, so it can run out of process
+        try:
+            start_command_process(
+                'sync_positions',
+                'sync_positions',
+                on_complete=store_open_count,
+                lock_key='sync_positions_lock',
+            )
+        except Exception:
+            cache.delete('sync_positions_lock')
+            cache.set('sync_positions_status', 'error', timeout=300)
+            raise
         
         return JsonResponse({
             'success': True,
@@ -2182,11 +2428,15 @@ def auto_expire_positions_api(request):
 
 def sync_positions_status_api(request):
     """API endpoint to check position sync status"""
-    status = cache.get('sync_positions_status', 'idle')
-    started = cache.get('sync_positions_started')
-    output = cache.get('sync_positions_output', '')
-    error = cache.get('sync_positions_error', '')
-    count = cache.get('sync_positions_count', 0)
+    state = cache.get_many([
+        'sync_positions_status', 'sync_positions_started', 'sync_positions_output',
+        'sync_positions_error', 'sync_positions_count',
+    ])
+    status = state.get('sync_positions_status', 'idle')
+    started = state.get('sync_positions_started')
+    output = state.get('sync_positions_output', '')
+    error = state.get('sync_positions_error', '')
+    count = state.get('sync_positions_count', 0)
     
     response = {
         'status': status,
@@ -2216,10 +2466,6 @@ def create_alert_api(request):
         return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
     
     try:
-        import json
-        from .services.alert_service import AlertService
-        from .models import OptionPosition, Stock
-        
         data = json.loads(request.body)
         alert_type = data.get('alert_type')
         
@@ -2280,33 +2526,35 @@ def create_alert_api(request):
 
 def list_alerts_api(request):
     """API endpoint to list user's alerts"""
-    from .models import Alert
-    
     try:
-        alerts = Alert.objects.filter(status='ACTIVE').select_related('position', 'stock')[:50]
+        # Plain dict rows with one join out to the position's stock - no model instances
+        rows = Alert.objects.filter(status='ACTIVE').values(
+            'id', 'alert_type', 'status', 'message', 'created_at', 'target_stock_price', 'target_premium',
+            'position_id', 'position__strike', 'position__option_type', 'position__stock__ticker',
+        )[:50]
         
         alert_list = []
-        for alert in alerts:
+        for row in rows:
             alert_data = {
-                'id': alert.id,
-                'type': alert.alert_type,
-                'status': alert.status,
-                'message': alert.message,
-                'created_at': alert.created_at.isoformat(),
+                'id': row['id'],
+                'type': row['alert_type'],
+                'status': row['status'],
+                'message': row['message'],
+                'created_at': row['created_at'].isoformat(),
             }
             
-            if alert.position:
+            if row['position_id']:
                 alert_data['position'] = {
-                    'ticker': alert.position.stock.ticker,
-                    'strike': float(alert.position.strike),
-                    'option_type': alert.position.option_type
+                    'ticker': row['position__stock__ticker'],
+                    'strike': float(row['position__strike']),
+                    'option_type': row['position__option_type']
                 }
             
-            if alert.target_stock_price:
-                alert_data['target_stock_price'] = float(alert.target_stock_price)
+            if row['target_stock_price']:
+                alert_data['target_stock_price'] = float(row['target_stock_price'])
             
-            if alert.target_premium:
-                alert_data['target_premium'] = float(alert.target_premium)
+            if row['target_premium']:
+                alert_data['target_premium'] = float(row['target_premium'])
             
             alert_list.append(alert_data)
         
@@ -2329,22 +2577,19 @@ def dismiss_alert_api(request, alert_id):
         return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
     
     try:
-        from .models import Alert
-        
-        alert = Alert.objects.get(id=alert_id)
-        alert.status = 'DISMISSED'
-        alert.save()
+        # Single UPDATE of the status column; 0 rows means the alert doesn't exist
+        updated = Alert.objects.filter(id=alert_id).update(status='DISMISSED')
+        if not updated:
+            return JsonResponse({
+                'success': False,
+                'error': 'Alert not found'
+            }, status=404)
         
         return JsonResponse({
             'success': True,
             'message': 'Alert dismissed'
         })
     
-    except Alert.DoesNotExist:
-        return JsonResponse({
-            'success': False,
-            'error': 'Alert not found'
-        }, status=404)
     except Exception as e:
         return JsonResponse({
             'success': False,
@@ -2358,7 +2603,6 @@ def save_telegram_chat_id(request):
         return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
     
     try:
-        import json
         data = json.loads(request.body)
         chat_id = data.get('chat_id')
         
@@ -2385,6 +2629,18 @@ def save_telegram_chat_id(request):
 # ORDER PLACEMENT API ENDPOINTS
 # ==========================================
 
+OPEN_ORDERS_CACHE_KEY = 'open_orders_v1'
+
+
+def _cached_open_orders(client):
+    """Open orders from IB Gateway, cached for 2s so bursty polling makes one RPC"""
+    orders = cache.get(OPEN_ORDERS_CACHE_KEY)
+    if orders is None:
+        orders = client.get_open_orders()
+        cache.set(OPEN_ORDERS_CACHE_KEY, orders, timeout=2)
+    return orders
+
+
 def place_order_api(request):
     """
     API endpoint to place an order through IBKR.
@@ -2408,7 +2664,8 @@ def place_order_api(request):
         return JsonResponse({'success': False, 'error': 'POST required'}, status=405)
     
     try:
-        data = json.loads(request.body)
+        # parse_float=Decimal keeps prices as the exact digits sent, no float round-trip
+        data = json.loads(request.body, parse_float=Decimal)
     except json.JSONDecodeError:
         return JsonResponse({'success': False, 'error': 'Invalid JSON'}, status=400)
     
@@ -2417,21 +2674,23 @@ def place_order_api(request):
     ticker = data.get('ticker', '').upper()
     quantity = int(data.get('quantity', 1))
     order_type = data.get('order_type', 'LMT').upper()
-    limit_price = data.get('limit_price')
+    limit_price_dec = data.get('limit_price')
     track_position = data.get('track_position', True)
     
     if not ticker:
         return JsonResponse({'success': False, 'error': 'Ticker is required'}, status=400)
     if action not in ('BUY', 'SELL'):
         return JsonResponse({'success': False, 'error': 'Action must be BUY or SELL'}, status=400)
-    if order_type == 'LMT' and limit_price is None:
+    if order_type == 'LMT' and limit_price_dec is None:
         return JsonResponse({'success': False, 'error': 'Limit price is required for limit orders'}, status=400)
     
-    if limit_price is not None:
-        limit_price = float(limit_price)
+    limit_price = None
+    if limit_price_dec is not None:
+        limit_price_dec = Decimal(limit_price_dec)
+        limit_price = float(limit_price_dec)
     
     try:
-        client = IBKRClient()
+        client = get_client()
         if not client.ensure_connected():
             return JsonResponse({
                 'success': False,
@@ -2451,7 +2710,8 @@ def place_order_api(request):
             if right not in ('P', 'C'):
                 return JsonResponse({'success': False, 'error': 'Right must be P (put) or C (call)'}, status=400)
             
-            strike = float(strike)
+            strike_dec = Decimal(strike)
+            strike = float(strike_dec)
             # Convert YYYY-MM-DD to YYYYMMDD for ib_insync
             expiry = expiry_str.replace('-', '')
             
@@ -2464,18 +2724,18 @@ def place_order_api(request):
             if result.get('success') and action == 'SELL' and track_position:
                 try:
                     stock, _ = Stock.objects.get_or_create(ticker=ticker, defaults={'name': ticker})
-                    expiry_date = datetime.strptime(expiry_str, '%Y-%m-%d').date() if '-' in expiry_str else datetime.strptime(expiry, '%Y%m%d').date()
-                    premium = limit_price or 0
+                    expiry_date = date.fromisoformat(expiry_str) if '-' in expiry_str else date(int(expiry[:4]), int(expiry[4:6]), int(expiry[6:8]))
+                    premium = limit_price_dec or Decimal('0')
                     
                     position = OptionPosition.objects.create(
                         stock=stock,
                         option_type='PUT' if right == 'P' else 'CALL',
-                        strike=Decimal(str(strike)),
+                        strike=strike_dec,
                         expiry_date=expiry_date,
                         contracts=quantity,
-                        entry_premium=Decimal(str(premium)),
-                        total_premium=Decimal(str(premium)) * quantity * 100,
-                        entry_stock_price=Decimal(str(stock.last_price or 0)),
+                        entry_premium=premium,
+                        total_premium=premium * quantity * 100,
+                        entry_stock_price=stock.last_price or Decimal('0'),
                         status='OPEN',
                         notes=f"IBKR Order #{result.get('order_id', 'N/A')} - {order_type} @ ${premium}"
                     )
@@ -2496,6 +2756,8 @@ def place_order_api(request):
             return JsonResponse({'success': False, 'error': f'Unsupported security type: {sec_type}'}, status=400)
         
         if result:
+            if result.get('success'):
+                cache.delete(OPEN_ORDERS_CACHE_KEY)
             return JsonResponse(result, status=200 if result.get('success') else 400)
         else:
             return JsonResponse({'success': False, 'error': 'No result from order placement'}, status=500)
@@ -2516,11 +2778,13 @@ def cancel_order_api(request):
         if not order_id:
             return JsonResponse({'success': False, 'error': 'order_id is required'}, status=400)
         
-        client = IBKRClient()
+        client = get_client()
         if not client.ensure_connected():
             return JsonResponse({'success': False, 'error': 'Could not connect to IB Gateway'}, status=503)
         
         result = client.cancel_order(int(order_id))
+        if result.get('success'):
+            cache.delete(OPEN_ORDERS_CACHE_KEY)
         return JsonResponse(result, status=200 if result.get('success') else 400)
     
     except Exception as e:
@@ -2530,14 +2794,14 @@ def cancel_order_api(request):
 def open_orders_api(request):
     """API endpoint to list all open orders from IBKR"""
     try:
-        client = IBKRClient()
+        client = get_client()
         if not client.ensure_connected():
             return JsonResponse({
                 'success': False,
                 'error': 'Could not connect to IB Gateway'
             }, status=503)
         
-        orders = client.get_open_orders()
+        orders = _cached_open_orders(client)
         return JsonResponse({
             'success': True,
             'orders': orders,
@@ -2563,21 +2827,14 @@ def option_quote_api(request):
         return JsonResponse({'success': False, 'error': 'ticker, expiry, strike, and right are required'}, status=400)
     
     try:
-        client = IBKRClient()
+        client = get_client()
         if not client.ensure_connected():
             return JsonResponse({'success': False, 'error': 'Could not connect to IB Gateway'}, status=503)
         
         quote = client.get_option_quote(ticker, expiry, float(strike), right)
         if quote:
-            # Sanitize NaN/Inf values - they're not valid JSON
-            import math
-            clean = {}
-            for k, v in quote.items():
-                if isinstance(v, float) and (math.isnan(v) or math.isinf(v)):
-                    clean[k] = None
-                else:
-                    clean[k] = v
-            return JsonResponse({'success': True, **clean})
+            # get_option_quote already maps NaN/Inf fields to None (or 0 for volume)
+            return JsonResponse({'success': True, **quote})
         else:
             return JsonResponse({'success': False, 'error': 'Could not get quote'}, status=404)
     
@@ -2588,24 +2845,21 @@ def option_quote_api(request):
 def orders_page(request):
     """Orders management page - view open orders, place new ones"""
     try:
-        client = IBKRClient()
+        client = get_client()
         connected = client.ensure_connected() if client else False
-        open_orders = client.get_open_orders() if connected else []
+        open_orders = _cached_open_orders(client) if connected else []
     except Exception:
         connected = False
         open_orders = []
     
-    # Get watchlist stocks for the order form
-    watchlist_stocks = Stock.objects.all().order_by('ticker')
-    
-    # Get all stocks as fallback
-    all_stocks = Stock.objects.all().order_by('ticker')
+    # One read of the stock list for the order form (watchlist and fallback share it)
+    stocks = list(Stock.objects.only('ticker', 'name', 'last_price').order_by('ticker'))
     
     return render(request, 'ibkr/orders.html', {
         'open_orders': open_orders,
         'connected': connected,
-        'watchlist_stocks': watchlist_stocks,
-        'all_stocks': all_stocks,
+        'watchlist_stocks': stocks,
+        'all_stocks': stocks,
     })
 
 
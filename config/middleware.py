@@ -2,9 +2,40 @@
 Custom middleware for development and cloud deployment
 """
 import base64
+import hmac
+from functools import lru_cache
 from django.conf import settings
 from django.http import HttpResponse
 
+# Served without Basic Auth: the health probe (exact path only) and static assets
+_AUTH_EXEMPT_PATH = '/health/'
+_AUTH_EXEMPT_PREFIX = '/static/'
+
+
+@lru_cache(maxsize=1024)
+def _check_basic_auth(auth_header, username, password):
+    """Validate a Basic Authorization header; cached so repeat requests skip the decode"""
+    try:
+        method, credentials = auth_header.split(' ', 1)
+        if method.lower() != 'basic':
+            return False
+        auth_user, auth_pass = base64.b64decode(credentials).decode('utf-8').split(':', 1)
+    except Exception:
+        return False
+    # compare_digest keeps the comparison constant-time; evaluate both to avoid a timing hint
+    user_ok = hmac.compare_digest(auth_user.encode(), username.encode())
+    pass_ok = hmac.compare_digest(auth_pass.encode(), password.encode())
+    return user_ok and pass_ok
+
+
+# Permissive Content Security Policy for VS Code Simple Browser (built once)
+_CSP = (
+    "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
+    "frame-ancestors *; "
+    "script-src * 'unsafe-inline' 'unsafe-eval'; "
+    "style-src * 'unsafe-inline';"
+)
+
 
 class VSCodeSimpleBrowserMiddleware:
     """
@@ -12,10 +43,18 @@ class VSCodeSimpleBrowserMiddleware:
     """
     def __init__(self, get_response):
         self.get_response = get_response
+        # Static/media assets are never framed, so their responses are left alone
+        self.skip_prefixes = tuple(
+            prefix for prefix in (settings.STATIC_URL, getattr(settings, 'MEDIA_URL', ''))
+            if prefix and prefix != '/'
+        )
 
     def __call__(self, request):
         response = self.get_response(request)
         
+        if request.path.startswith(self.skip_prefixes) or getattr(response, 'status_code', 200) in (204, 304):
+            return response
+        
         # Remove restrictive headers and add permissive ones for VS Code Simple Browser
         if hasattr(response, 'headers'):
             # Remove any existing X-Frame-Options
@@ -23,12 +62,7 @@ class VSCodeSimpleBrowserMiddleware:
                 del response.headers['X-Frame-Options']
             
             # Add permissive Content Security Policy
-            response.headers['Content-Security-Policy'] = (
-                "default-src * 'unsafe-inline' 'unsafe-eval' data: blob:; "
-                "frame-ancestors *; "
-                "script-src * 'unsafe-inline' 'unsafe-eval'; "
-                "style-src * 'unsafe-inline';"
-            )
+            response.headers['Content-Security-Policy'] = _CSP
         
         return response
 
@@ -50,20 +84,12 @@ class BasicAuthMiddleware:
         if not username or not password:
             return self.get_response(request)
 
-        if request.path == '/health/' or request.path.startswith('/static/'):
+        if request.path == _AUTH_EXEMPT_PATH or request.path.startswith(_AUTH_EXEMPT_PREFIX):
             return self.get_response(request)
 
         auth_header = request.META.get('HTTP_AUTHORIZATION', '')
-        if auth_header:
-            try:
-                method, credentials = auth_header.split(' ', 1)
-                if method.lower() == 'basic':
-                    decoded = base64.b64decode(credentials).decode('utf-8')
-                    auth_user, auth_pass = decoded.split(':', 1)
-                    if auth_user == username and auth_pass == password:
-                        return self.get_response(request)
-            except (ValueError, Exception):
-                pass
+        if auth_header and _check_basic_auth(auth_header, username, password):
+            return self.get_response(request)
 
         response = HttpResponse('Authentication required', status=401)
         response['WWW-Authenticate'] = 'Basic realm="IBKR Wheel Strategy"'
@@ -1,19 +1,63 @@
 from pathlib import Path
 import os
-from decouple import config
 
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+
+def _read_env_file(path):
+    """KEY=VALUE pairs from a .env file, parsed once at startup"""
+    values = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#') or '=' not in line:
+                    continue
+                key, value = line.split('=', 1)
+                values[key.strip()] = value.strip().strip('\'"')
+    except FileNotFoundError:
+        pass
+    return values
+
+
+# Process environment overrides .env (same precedence python-decouple used)
+_ENV = {**_read_env_file(BASE_DIR / '.env'), **os.environ}
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'y', 'on', 't'})
+
+
+def _bool(value):
+    return value.strip().lower() in _TRUE_VALUES
+
+
+def _env(key, default=None, cast=str):
+    """Single dict lookup; cast only applies to values actually set"""
+    value = _ENV.get(key)
+    return cast(value) if value is not None else default
+
+
+def _split_csv(value):
+    """Comma-separated env value -> tuple of non-empty, stripped items"""
+    return tuple(item.strip() for item in value.split(',') if item.strip())
+
+
+# Used when CSRF_TRUSTED_ORIGINS isn't set (ngrok tunnels + local dev server)
+_DEFAULT_CSRF = (
+    'https://*.ngrok-free.app',
+    'https://*.ngrok.io',
+    'http://localhost:8000',
+    'http://127.0.0.1:8000',
+)
+
+
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = config('SECRET_KEY', default='django-insecure-dev-key-change-in-production')
+SECRET_KEY = _env('SECRET_KEY', 'django-insecure-dev-key-change-in-production')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = config('DEBUG', default=True, cast=bool)
+DEBUG = _env('DEBUG', True, _bool)
 
 # Parse ALLOWED_HOSTS - accept all Railway domains
-ALLOWED_HOSTS_RAW = config('ALLOWED_HOSTS', default='localhost,127.0.0.1')
-ALLOWED_HOSTS = [host.strip() for host in ALLOWED_HOSTS_RAW.split(',') if host.strip()]
+ALLOWED_HOSTS = list(_split_csv(_env('ALLOWED_HOSTS', 'localhost,127.0.0.1')))
 
 # Add Railway wildcard patterns explicitly
 if not DEBUG:
@@ -51,6 +95,11 @@ MIDDLEWARE = [
     'django_browser_reload.middleware.BrowserReloadMiddleware',
 ]
 
+# Live reload is only mounted in DEBUG (config/urls.py); keep it out of production requests
+if not DEBUG:
+    INSTALLED_APPS = [app for app in INSTALLED_APPS if 'browser_reload' not in app]
+    MIDDLEWARE = [m for m in MIDDLEWARE if 'browser_reload' not in m]
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
@@ -73,13 +122,48 @@ TEMPLATES = [
 WSGI_APPLICATION = 'config.wsgi.application'
 
 # Database
+DB_PATH = str(BASE_DIR / 'db.sqlite3')
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': DB_PATH,
+        # Keep connections open across requests so the pragmas below run once per
+        # connection, not once per request; health checks drop a broken one on reuse
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        'ATOMIC_REQUESTS': False,
+        'OPTIONS': {
+            'timeout': 20,  # wait on a locked DB instead of failing immediately
+        },
     }
 }
 
+# Run on every new SQLite connection (see apps.ibkr.apps). Django 5.0's sqlite backend
+# has no OPTIONS['init_command'], so they are applied from a connection_created receiver.
+# WAL lets readers run alongside the option-sync writers; NORMAL sync is safe under WAL.
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+)
+
+# Cache - per-process local memory (status keys for background jobs, short-lived
+# dashboard aggregates). Memoized per-stock scores get their own store: there are
+# several per stock, and culling them out of 'default' would evict the job locks
+# and *_status keys that live there
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ibkr-wheel',
+    },
+    'scores': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'ibkr-wheel-scores',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+}
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -96,14 +180,27 @@ USE_TZ = True
 
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = 'static/'
-STATIC_ROOT = BASE_DIR / 'staticfiles'
-STATICFILES_DIRS = [BASE_DIR / 'static']
-# Use WhiteNoise storage without manifest (to avoid missing file errors)
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedStaticFilesStorage'
+STATIC_ROOT = str(BASE_DIR / 'staticfiles')
+STATICFILES_DIRS = [str(BASE_DIR / 'static')]
+# Hashed filenames + pre-built .gz/.br siblings, served with a far-future Cache-Control.
+# Compression is skipped in development (COMPRESS_STATIC defaults to off when DEBUG)
+# so collectstatic doesn't gzip/brotli every asset on each run.
+# Non-strict manifest so a {% static %} tag for a file missing from the manifest falls
+# back to its unhashed name. References inside CSS/JS (url(), sourceMappingURL) are
+# still resolved by collectstatic and fail it if missing - vendored files ship without them
+if _env('COMPRESS_STATIC', not DEBUG, _bool):
+    STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+else:
+    STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+WHITENOISE_MANIFEST_STRICT = False
+WHITENOISE_MAX_AGE = 31536000
+WHITENOISE_USE_FINDERS = False
+# Only re-scan static files per request while developing
+WHITENOISE_AUTOREFRESH = DEBUG
 
 # Media files
 MEDIA_URL = 'media/'
-MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_ROOT = str(BASE_DIR / 'media')
 
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -115,25 +212,25 @@ INTERNAL_IPS = ['127.0.0.1']
 # Email configuration (Resend)
 # Use console backend to avoid crashes - email sending disabled in production for now
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
-RESEND_API_KEY = config('RESEND_API_KEY', default='')
-DEFAULT_FROM_EMAIL = config('EMAIL_FROM', default='noreply@localhost')
+RESEND_API_KEY = _env('RESEND_API_KEY', '')
+DEFAULT_FROM_EMAIL = _env('EMAIL_FROM', 'noreply@localhost')
 SERVER_EMAIL = DEFAULT_FROM_EMAIL
 
 # IBKR Configuration
-IBKR_HOST = config('IBKR_HOST', default='127.0.0.1')
-IBKR_PORT = config('IBKR_PORT', default=4001, cast=int)  # 4001 for IB Gateway, 7497 for TWS
-IBKR_CLIENT_ID = config('IBKR_CLIENT_ID', default=1, cast=int)
-IBKR_PAPER_TRADING = config('IBKR_PAPER_TRADING', default=True, cast=bool)
+IBKR_HOST = _env('IBKR_HOST', '127.0.0.1')
+IBKR_PORT = _env('IBKR_PORT', 4001, int)  # 4001 for IB Gateway, 7497 for TWS
+IBKR_CLIENT_ID = _env('IBKR_CLIENT_ID', 1, int)
+IBKR_PAPER_TRADING = _env('IBKR_PAPER_TRADING', True, _bool)
 
 # IB Gateway Docker Configuration (used when running in containers)
-IBKR_USERNAME = config('IBKR_USERNAME', default='')
-IBKR_PASSWORD = config('IBKR_PASSWORD', default='')
-IBKR_TRADING_MODE = config('IBKR_TRADING_MODE', default='paper')  # 'paper' or 'live'
-VNC_PASSWORD = config('VNC_PASSWORD', default='ibkrvnc')
+IBKR_USERNAME = _env('IBKR_USERNAME', '')
+IBKR_PASSWORD = _env('IBKR_PASSWORD', '')
+IBKR_TRADING_MODE = _env('IBKR_TRADING_MODE', 'paper')  # 'paper' or 'live'
+VNC_PASSWORD = _env('VNC_PASSWORD', 'ibkrvnc')
 
 # Application Settings
-SITE_NAME = config('SITE_NAME', default='IBKR Wheel Strategy')
-SITE_URL = config('SITE_URL', default='http://localhost:8000')
+SITE_NAME = _env('SITE_NAME', 'IBKR Wheel Strategy')
+SITE_URL = _env('SITE_URL', 'http://localhost:8000')
 
 # Allow embedding in VS Code Simple Browser (development only)
 if DEBUG:
@@ -142,23 +239,14 @@ if DEBUG:
     SECURE_REFERRER_POLICY = None
 
 # Ngrok / Reverse Proxy support
-CSRF_TRUSTED_ORIGINS = [
-    origin.strip()
-    for origin in config('CSRF_TRUSTED_ORIGINS', default='').split(',')
-    if origin.strip()
-] or [
-    'https://*.ngrok-free.app',
-    'https://*.ngrok.io',
-    'http://localhost:8000',
-    'http://127.0.0.1:8000',
-]
+CSRF_TRUSTED_ORIGINS = list(_split_csv(_env('CSRF_TRUSTED_ORIGINS', '')) or _DEFAULT_CSRF)
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')
 USE_X_FORWARDED_HOST = True
 
 # Basic Auth for cloud deployment (set in .env to enable password protection)
 # Leave empty to disable (local development)
-BASIC_AUTH_USER = config('BASIC_AUTH_USER', default='')
-BASIC_AUTH_PASS = config('BASIC_AUTH_PASS', default='')
+BASIC_AUTH_USER = _env('BASIC_AUTH_USER', '')
+BASIC_AUTH_PASS = _env('BASIC_AUTH_PASS', '')
 
 # Logging — quiet down ib_insync pre-login connection errors (expected during startup)
 LOGGING = {
@@ -1,14 +1,19 @@
 import os
-import sys
-import django
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-django.setup()
 
-from django.core.management import call_command
+def main():
+    from django.core.management import call_command
 
-print("Creating migrations...")
-call_command('makemigrations', 'ibkr')
-print("\nRunning migrations...")
-call_command('migrate')
-print("\nDone!")
+    print("Creating migrations...")
+    call_command('makemigrations', 'ibkr')
+    print("\nRunning migrations...")
+    call_command('migrate')
+    print("\nDone!")
+
+
+if __name__ == '__main__':
+    # Standalone run; under scripts/preload.py Django is already set up
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    main()
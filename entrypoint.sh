@@ -9,8 +9,8 @@ echo "Starting on port $PORT..."
 # Run migrations
 python manage.py migrate --noinput
 
-# Collect static files
-python manage.py collectstatic --noinput
+# Collect static files (rebuilds the hashed manifest and .gz/.br variants)
+python manage.py collectstatic --noinput --clear
 
 # Start gunicorn
 exec gunicorn --bind 0.0.0.0:$PORT --workers 2 --timeout 300 --access-logfile - --error-logfile - config.wsgi:application
@@ -0,0 +1,100 @@
+"""
+Preloader for the ad-hoc debug scripts
+Keeps one process with Django already set up and runs scripts on request over a
+UNIX socket, so iterating on verify_data.py / test_sync_debug.py doesn't pay the
+full django.setup() import cost every run.
+
+    python scripts/preload.py serve          # start the preloader (leave it running)
+    python scripts/preload.py verify_data    # run a script inside it
+"""
+import contextlib
+import importlib
+import os
+import socket
+import socketserver
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SOCKET_PATH = os.environ.get('PRELOAD_SOCKET', str(BASE_DIR / '.preload.sock'))
+
+# Script name -> module at the project root exposing main()
+SCRIPTS = {
+    'verify_data': 'verify_data',
+    'create_migration': 'create_migration',
+    'test_sync_debug': 'test_sync_debug',
+}
+
+
+class _ScriptHandler(socketserver.StreamRequestHandler):
+    """One script per connection; the script's stdout/stderr go back over the socket"""
+
+    def handle(self):
+        name = self.rfile.readline().decode().strip()
+        stream = _SocketText(self.wfile)
+        with contextlib.redirect_stdout(stream), contextlib.redirect_stderr(stream):
+            if name not in SCRIPTS:
+                print(f"❌ Unknown script '{name}'. Available: {', '.join(SCRIPTS)}")
+                return
+            try:
+                module = importlib.import_module(SCRIPTS[name])
+                # Pick up edits made since the last run without restarting the preloader
+                module = importlib.reload(module)
+                module.main()
+            except Exception as e:
+                print(f"❌ {name} failed: {e}")
+
+
+class _SocketText:
+    """Minimal text file wrapper writing UTF-8 to the client socket"""
+
+    def __init__(self, wfile):
+        self.wfile = wfile
+
+    def write(self, text):
+        self.wfile.write(text.encode())
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def serve():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    sys.path.insert(0, str(BASE_DIR))
+    import django
+    django.setup()
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(SOCKET_PATH)
+    with socketserver.UnixStreamServer(SOCKET_PATH, _ScriptHandler) as server:
+        print(f"✅ Django preloaded, listening on {SOCKET_PATH}")
+        try:
+            server.serve_forever()
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(SOCKET_PATH)
+
+
+def run(name):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(SOCKET_PATH)
+        except (FileNotFoundError, ConnectionRefusedError):
+            print("❌ Preloader not running - start it with: python scripts/preload.py serve")
+            return 1
+        sock.sendall(f"{name}\n".encode())
+        while chunk := sock.recv(65536):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(__doc__)
+        sys.exit(2)
+    if sys.argv[1] == 'serve':
+        serve()
+    else:
+        sys.exit(run(sys.argv[1]))
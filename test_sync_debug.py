@@ -1,26 +1,37 @@
 import os
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-import django
-django.setup()
-
-from apps.ibkr.models import Stock
-from apps.ibkr.services.yfinance_options import YFinanceOptionsService
-
-# Get first stock
-stock = Stock.objects.first()
-print(f"Testing with: {stock.ticker}")
-print(f"Stock last_price: {stock.last_price}")
-
-# Fetch options
-print("\nFetching options...")
-options_data = YFinanceOptionsService.get_options_chain(stock.ticker, max_expiries=2)
-
-print(f"\nReturned {len(options_data)} options")
-
-if options_data:
-    print("\nFirst option:")
-    opt = options_data[0]
-    for key, value in opt.items():
-        print(f"  {key}: {value}")
-else:
-    print("No options returned!")
+
+
+def main():
+    from apps.ibkr.models import Stock
+
+    # Get first stock - just the columns used below, no model instance
+    row = Stock.objects.values_list('ticker', 'last_price').first()
+    if row is None:
+        print("No stocks in the database!")
+        return
+    ticker, last_price = row
+    print(f"Testing with: {ticker}")
+    print(f"Stock last_price: {last_price}")
+
+    # Fetch options - yfinance (and pandas) only load once there's something to fetch
+    from apps.ibkr.services.yfinance_options import YFinanceOptionsService
+    print("\nFetching options...")
+    options_data = YFinanceOptionsService.get_options_chain(ticker, max_expiries=2)
+
+    print(f"\nReturned {len(options_data)} options")
+
+    if options_data:
+        print("\nFirst option:")
+        opt = options_data[0]
+        for key, value in opt.items():
+            print(f"  {key}: {value}")
+    else:
+        print("No options returned!")
+
+
+if __name__ == '__main__':
+    # Standalone run; under scripts/preload.py Django is already set up
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    main()
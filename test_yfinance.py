@@ -1,20 +1,34 @@
-import yfinance as yf
+import sys
 
-ticker = yf.Ticker('AAPL')
-print('Options expiration dates:')
-print(ticker.options)
-print()
 
-if ticker.options:
-    print(f'Found {len(ticker.options)} expiration dates')
-    print(f'First expiry: {ticker.options[0]}')
-    
-    chain = ticker.option_chain(ticker.options[0])
-    print(f'Calls: {len(chain.calls)}')
-    print(f'Puts: {len(chain.puts)}')
-    
-    if len(chain.calls) > 0:
-        print('\nSample call data:')
-        print(chain.calls[['strike', 'bid', 'ask', 'volume', 'openInterest']].head())
-else:
-    print('No options found!')
+def main(symbol='AAPL'):
+    # Imported here so usage errors exit without loading yfinance/pandas
+    import yfinance as yf
+
+    ticker = yf.Ticker(symbol)
+    print('Options expiration dates:')
+    print(ticker.options)
+    print()
+
+    if ticker.options:
+        print(f'Found {len(ticker.options)} expiration dates')
+        print(f'First expiry: {ticker.options[0]}')
+        
+        chain = ticker.option_chain(ticker.options[0])
+        print(f'Calls: {len(chain.calls)}')
+        print(f'Puts: {len(chain.puts)}')
+        
+        if len(chain.calls) > 0:
+            print('\nSample call data:')
+            # Plain dicts: greppable and skips pandas' DataFrame repr
+            for row in chain.calls.head()[['strike', 'bid', 'ask', 'volume', 'openInterest']].to_dict('records'):
+                print(row)
+    else:
+        print('No options found!')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        print('Usage: python test_yfinance.py [TICKER]')
+        sys.exit(2)
+    main(sys.argv[1].upper() if len(sys.argv) == 2 else 'AAPL')
@@ -1,16 +1,43 @@
 import os
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-import django
-django.setup()
 
-from apps.ibkr.models import Option
 
-print(f'Total options: {Option.objects.count()}')
-print(f'Options with bid: {Option.objects.filter(bid__isnull=False).count()}')
-print(f'Options with ask: {Option.objects.filter(ask__isnull=False).count()}')
-print(f'Options with delta: {Option.objects.filter(delta__isnull=False).count()}')
-print(f'Options with implied_volatility: {Option.objects.filter(implied_volatility__isnull=False).count()}')
+def main():
+    from django.db.models import Case, Count, F, FloatField, Q, When
+    from django.utils import timezone
+    from apps.ibkr.models import Option
 
-print('\n5 Sample AAPL options:')
-for opt in Option.objects.filter(stock__ticker='AAPL', option_type='PUT')[:5]:
-    print(f'  ${opt.strike} {opt.option_type} {opt.expiry_date}: Bid={opt.bid}, Ask={opt.ask}, Mid={opt.mid_price}, Delta={opt.delta}, DTE={opt.dte}')
+    # All coverage counts in one pass over the table
+    stats = Option.objects.aggregate(
+        total=Count('id'),
+        bid=Count('id', filter=Q(bid__isnull=False)),
+        ask=Count('id', filter=Q(ask__isnull=False)),
+        delta=Count('id', filter=Q(delta__isnull=False)),
+        iv=Count('id', filter=Q(implied_volatility__isnull=False)),
+    )
+    print(f"Total options: {stats['total']}")
+    print(f"Options with bid: {stats['bid']}")
+    print(f"Options with ask: {stats['ask']}")
+    print(f"Options with delta: {stats['delta']}")
+    print(f"Options with implied_volatility: {stats['iv']}")
+
+    print('\n5 Sample AAPL options:')
+    # Plain rows with the mid price computed in SQL (same rule as Option.mid_price)
+    sample = Option.objects.filter(stock__ticker='AAPL', option_type='PUT').annotate(
+        mid=Case(
+            When(bid__gt=0, ask__gt=0, then=(F('bid') + F('ask')) / 2),
+            default=F('last'),
+            output_field=FloatField(),
+        ),
+    ).values('strike', 'option_type', 'expiry_date', 'bid', 'ask', 'mid', 'delta')[:5]
+    today = timezone.now().date()
+    for opt in sample:
+        dte = (opt['expiry_date'] - today).days
+        print(f"  ${opt['strike']} {opt['option_type']} {opt['expiry_date']}: Bid={opt['bid']}, Ask={opt['ask']}, Mid={opt['mid']}, Delta={opt['delta']}, DTE={dte}")
+
+
+if __name__ == '__main__':
+    # Standalone run; under scripts/preload.py Django is already set up
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    import django
+    django.setup()
+    main()